@@ -0,0 +1,47 @@
+"""
+Compare migrating records between two versions of a type with a compiled
+converter against converting each record with _asdict, renaming and dropping
+keys of the dict and constructing the new version with **kwargs.
+
+    python benchmarks/converter.py [num_records]
+"""
+import sys
+import time
+from namedtuple3 import namedtuple, converter
+
+
+RowV1 = namedtuple('Row', 'url publication_date author legacy_id')
+RowV2 = namedtuple('Row', 'url published author size')
+
+
+def _dict_convert_all(records):
+    for record in records:
+        values = record._asdict()
+        values['published'] = values.pop('publication_date')
+        del values['legacy_id']
+        values.setdefault('size', 0)
+        yield RowV2(**values)
+
+
+def benchmark(num_records=1000000):
+
+    records = [RowV1('http://example.com/%d.pdf' % i, '2016-05-15',
+                     'pdf995', i) for i in range(num_records)]
+    convert_all = converter(RowV1, RowV2,
+                            renames={'publication_date': 'published'},
+                            defaults={'size': 0}).convert_all
+
+    for name, migrate in [
+        ('_asdict + **kwargs', _dict_convert_all),
+        ('converter', convert_all),
+    ]:
+        start = time.time()
+        migrated = list(migrate(records))
+        elapsed = time.time() - start
+        assert migrated[-1] == RowV2(records[-1].url, '2016-05-15', 'pdf995', 0)
+        print('%-20s %6.2fs, %10.0f records/s' %
+              (name, elapsed, num_records / elapsed))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(x) for x in sys.argv[1:2]])
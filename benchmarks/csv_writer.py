@@ -0,0 +1,60 @@
+"""
+Compare the rows per second written by NamedTupleWriter against writing the
+same records with csv.DictWriter.
+
+    python benchmarks/csv_writer.py [num_records]
+"""
+import sys
+import csv
+import timeit
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+from namedtuple3 import namedtuple, NamedTupleWriter
+
+
+@namedtuple
+def Row(url, publication_date, author, size):
+    """a row of some csv file"""
+
+
+def _dict_writer(records, field_names):
+    writer = csv.DictWriter(StringIO(), field_names, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(r._asdict() for r in records)
+
+
+def _named_tuple_writer(records, field_names, formatters=None):
+    with NamedTupleWriter(StringIO(), Row, field_names,
+                          formatters=formatters) as writer:
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def benchmark(num_records):
+
+    records = [Row('http://www.pdf995.com/samples/%d.pdf' % i, '2016-05-15',
+                   'pdf995', i)
+               for i in range(num_records)]
+
+    cases = [
+        ('DictWriter, all fields',
+         lambda: _dict_writer(records, Row._fields)),
+        ('NamedTupleWriter, all fields',
+         lambda: _named_tuple_writer(records, None)),
+        ('DictWriter, author url',
+         lambda: _dict_writer(records, ['author', 'url'])),
+        ('NamedTupleWriter, author url',
+         lambda: _named_tuple_writer(records, 'author url')),
+        ('NamedTupleWriter, author url, formatted',
+         lambda: _named_tuple_writer(records, 'author url',
+                                     {'url': str.upper})),
+    ]
+    for name, fn in cases:
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print('%-40s %10.0f rows/s' % (name, num_records / seconds))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(x) for x in sys.argv[1:2]] or [200000])
@@ -0,0 +1,65 @@
+"""
+Compare the pickled size and the time to unpickle and decode a stream of
+slowly changing records sent in full against the same stream sent as deltas.
+Deltas are smaller, decoding them is slower.
+
+    python benchmarks/delta.py [num_records]
+"""
+import sys
+import time
+import random
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+from namedtuple3 import namedtuple, DeltaEncoder, DeltaDecoder
+
+
+@namedtuple
+def Metrics(host, region, state, version, cpu, memory, disk, connections):
+    """metrics of some host"""
+
+
+def _records(num_records):
+    """
+    :return: list of records where each record changes one or two fields of
+             the previous one
+    """
+    random.seed(0)
+    record = Metrics('host-1', 'eu-west', 'up', '1.2.3', 0.5, 1024, 50000, 10)
+    records = []
+    for _ in range(num_records):
+        record = record._replace(cpu=round(random.random(), 2))
+        if random.random() < 0.2:
+            record = record._replace(connections=random.randint(0, 100))
+        records.append(record)
+    return records
+
+
+def benchmark(num_records=100000):
+
+    records = _records(num_records)
+
+    # full records: the values of each record as a plain tuple
+    data = pickle.dumps([tuple(r) for r in records], pickle.HIGHEST_PROTOCOL)
+    start = time.time()
+    decoded = [tuple.__new__(Metrics, values) for values in pickle.loads(data)]
+    full_time = time.time() - start
+    full_bytes = len(data)
+    assert decoded == records
+
+    deltas = list(DeltaEncoder(Metrics).encode_all(records))
+    data = pickle.dumps(deltas, pickle.HIGHEST_PROTOCOL)
+    start = time.time()
+    decoded = list(DeltaDecoder(Metrics).decode_all(pickle.loads(data)))
+    delta_time = time.time() - start
+    delta_bytes = len(data)
+    assert decoded == records
+
+    print('%d records, time to unpickle and decode' % num_records)
+    print('full records: %6.3fs, %10d bytes' % (full_time, full_bytes))
+    print('deltas:       %6.3fs, %10d bytes' % (delta_time, delta_bytes))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(x) for x in sys.argv[1:2]])
@@ -0,0 +1,70 @@
+"""
+Compare handing a large table of records to a pool of workers by pickling a
+copy for each worker against sharing a single SharedTable which the workers
+attach to by name.
+
+    python benchmarks/shared_table.py [num_records] [num_workers]
+"""
+import sys
+import time
+import pickle
+import multiprocessing
+from namedtuple3 import namedtuple, SharedTable
+
+
+@namedtuple
+def Price(id, name, price):
+    """a price of some product"""
+
+
+# so that the records can be pickled to send to the workers
+Price.__module__ = __name__
+
+
+FORMAT = '<q16sd'
+
+
+def _total_copied(records):
+    return sum(r.price for r in records)
+
+
+def _total_shared(name):
+    with SharedTable.attach(name, Price, FORMAT) as table:
+        return sum(r.price for r in table)
+
+
+def benchmark(num_records=1000000, num_workers=4):
+
+    records = [Price(i, 'product %d' % i, i * 1.5) for i in range(num_records)]
+    pool = multiprocessing.Pool(num_workers)
+    try:
+        start = time.time()
+        copied = pool.map(_total_copied, [records] * num_workers)
+        copied_time = time.time() - start
+        copied_bytes = len(pickle.dumps(records, pickle.HIGHEST_PROTOCOL))
+
+        table = SharedTable.create(Price, FORMAT, records)
+        try:
+            start = time.time()
+            shared = pool.map(_total_shared, [table.name] * num_workers)
+            shared_time = time.time() - start
+            shared_bytes = table.nbytes
+        finally:
+            table.close()
+            table.unlink()
+    finally:
+        pool.close()
+        pool.join()
+
+    assert copied == shared
+
+    print('%d records, %d workers' % (num_records, num_workers))
+    print('per-worker copies: %6.2fs, %10d bytes pickled per worker, '
+          'one unpickled copy of the records per worker'
+          % (copied_time, copied_bytes))
+    print('shared table:      %6.2fs, %10d bytes shared by all workers'
+          % (shared_time, shared_bytes))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(x) for x in sys.argv[1:3]])
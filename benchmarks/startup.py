@@ -0,0 +1,82 @@
+"""
+Measure the startup cost of a tool which defines its record types at import:
+the time to import namedtuple3 in a fresh interpreter and the modules it
+loads, then the time to define a type with each of the supported forms.
+
+    python benchmarks/startup.py [num_types]
+
+For a per module breakdown of the import on python 3.7+ use:
+
+    python -X importtime -c "import namedtuple3"
+"""
+import sys
+import time
+import subprocess
+from namedtuple3 import namedtuple
+
+
+_import_code = '''\
+import sys, time
+before = set(sys.modules)
+start = time.time()
+import namedtuple3
+print('%f %d' % (time.time() - start, len(set(sys.modules) - before)))
+'''
+
+
+def _import(repeat):
+    """
+    :return: the fastest time to import namedtuple3 in a new interpreter, and
+             the number of modules loaded by the import
+    """
+    results = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', _import_code])
+        seconds, num_modules = output.split()
+        results.append((float(seconds), int(num_modules)))
+    return min(results)
+
+
+def _define_std(i):
+    return namedtuple('Std%d' % i, 'url size weight')
+
+
+def _define_function(i):
+    def Function(url, size, weight):
+        """a document"""
+    Function.__name__ = 'Function%d' % i
+    return namedtuple(Function)
+
+
+def _define_class(i):
+    class Class(object):
+        """a document"""
+        def __init__(self, url, size, weight):
+            pass
+    Class.__name__ = 'Class%d' % i
+    return namedtuple(Class)
+
+
+def benchmark(num_types=50, repeat=5):
+
+    seconds, num_modules = _import(repeat)
+    print('%-40s %6.1f ms, %d modules' %
+          ('import namedtuple3', seconds * 1e3, num_modules))
+
+    for name, define in [
+        ('std', _define_std),
+        ('function decorator', _define_function),
+        ('class decorator', _define_class),
+    ]:
+        # every type has a different name, so none of them are memoized
+        start = time.time()
+        for i in range(num_types):
+            define(i)
+        elapsed = time.time() - start
+        print('%-40s %6.1f ms, %.0f us per type' %
+              ('define %d types (%s)' % (num_types, name), elapsed * 1e3,
+               elapsed / num_types * 1e6))
+
+
+if __name__ == '__main__':
+    benchmark(*[int(x) for x in sys.argv[1:2]])
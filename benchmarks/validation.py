@@ -0,0 +1,34 @@
+"""
+Compare the cost of constructing records of a type without declared field
+types, with declared types while validation is off, and with validation on.
+
+    python benchmarks/validation.py
+"""
+import timeit
+from namedtuple3 import namedtuple, set_validation
+
+
+def benchmark(number=1000000):
+
+    Plain = namedtuple('Plain', 'url size weight')
+    Typed = namedtuple('Typed', 'url size weight',
+                       types=(str, int, float))
+    set_validation(True)
+    try:
+        Validated = namedtuple('Validated', 'url size weight',
+                               types=(str, int, float))
+    finally:
+        set_validation(False)
+
+    for record_type in Plain, Typed, Validated:
+        for name, statement in [
+            ('%s(...)', lambda: record_type('a.pdf', 1, 0.5)),
+            ('%s._make', lambda: record_type._make(('a.pdf', 1, 0.5))),
+        ]:
+            seconds = min(timeit.repeat(statement, number=number, repeat=3))
+            print('%-20s %6.0f ns' % (name % record_type.__name__,
+                                      seconds / number * 1e9))
+
+
+if __name__ == '__main__':
+    benchmark()
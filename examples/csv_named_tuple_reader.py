@@ -3,7 +3,7 @@ try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
-from namedtuple3 import namedtuple
+from namedtuple3 import namedtuple, external_sort, NamedTupleWriter
 
 
 class NamedTupleReader:
@@ -16,6 +16,10 @@ class NamedTupleReader:
         self._field_names = next(self._reader)
         self._row_factory = self._init_row_factory()
 
+    @property
+    def row_type(self):
+        return self._row_factory
+
     def _init_row_factory(self):
         @namedtuple(self._field_names, rename=True)
         def Row():
@@ -36,7 +40,9 @@ def example():
     # to sort records by url. This could be done with DictReader, but then we
     # create a dict for each row returned, and access the url value by looking
     # up in the dict, which is more expensive and a little less readable, e.g.
-    # row.url vs row['url']
+    # row.url vs row['url']. The file may not fit in memory, so rather than
+    # sorted the rows are sorted with external_sort, which spills sorted runs
+    # of run_size rows to temporary files and merges them back.
 
     reader = NamedTupleReader(StringIO(
         'url,publication_date,author\n'
@@ -45,11 +51,16 @@ def example():
         'http://www.pdf995.com/samples/pdf.pdf,2016-01-15,pdf995\n'
     ))
 
+    # The sorted rows are written back out with the header taken from the
+    # fields of the row type.
     result = StringIO()
-    writer = csv.writer(result, lineterminator='\n')
-    writer.writerows(sorted(reader, key=lambda r: r.url))
+    with NamedTupleWriter(result, reader.row_type,
+                          lineterminator='\n') as writer:
+        writer.writeheader()
+        writer.writerows(external_sort(reader, 'url', run_size=2))
 
     expected = (
+        'url,publication_date,author\n'
         'http://www.pdf995.com/samples/pdf.pdf,2016-05-15,pdf995\n'
         'http://www.pdf995.com/samples/pdf.pdf,2016-01-15,pdf995\n'
         'http://www.publishers.org.uk/_resources/assets/attachment/full/0/2091.pdf,2016-06-03,Example Author\n'
@@ -1 +1,14 @@
-from namedtuple3._namedtuple3_impl import namedtuple
\ No newline at end of file
+from namedtuple3._namedtuple3_impl import namedtuple, set_validation
+from namedtuple3._table_impl import Table
+from namedtuple3._sort_impl import external_sort
+from namedtuple3._aggregate_impl import (
+    group_by, Aggregator, Count, Sum, Min, Max, Mean, First, Last,
+)
+from namedtuple3._join_impl import join
+from namedtuple3._csv_impl import IncrementalReader, NamedTupleWriter
+from namedtuple3._shared_impl import SharedTable
+from namedtuple3._numpy_impl import to_numpy, from_numpy, RecordArray
+from namedtuple3._fixed_width_impl import fixed_width_parser, FixedWidthReader
+from namedtuple3._delta_impl import DeltaEncoder, DeltaDecoder
+from namedtuple3._convert_impl import converter
+from namedtuple3._window_impl import tumbling_window, sliding_window
@@ -0,0 +1,194 @@
+# std
+from collections import OrderedDict
+from itertools import groupby
+from operator import itemgetter
+# namedtuple3
+from namedtuple3._namedtuple3_impl import _namedtuple
+from namedtuple3._common_impl import (
+    _check_unexpected_kwargs, _parse_field_names, _peek_type,
+)
+
+
+class Aggregator(object):
+    """
+    Base class for aggregators. An aggregator is bound to a record type to
+    give three functions:
+
+    - start(record) returning the state for a group from its first record
+    - step(state, record) returning the state after another record
+    - result(state) returning the aggregated value for the group
+
+    States are replaced rather than mutated, so they are typically numbers or
+    small tuples.
+    """
+
+    function_name = None
+
+    def __init__(self, field_name=None, name=None):
+        self.field_name = field_name
+        self.name = name or '_'.join(
+            x for x in (self.function_name, field_name) if x)
+
+    def _getter(self, record_type):
+        _, positions = _parse_field_names(record_type, [self.field_name])
+        return itemgetter(*positions)
+
+    def bind(self, record_type):
+        """
+        :return: (start, step, result) functions for records of record_type
+        """
+        raise NotImplementedError
+
+
+def _identity(state):
+    return state
+
+
+class Count(Aggregator):
+    """number of records in the group"""
+
+    function_name = 'count'
+
+    def bind(self, record_type):
+        return (lambda record: 1), (lambda state, record: state + 1), _identity
+
+
+class Sum(Aggregator):
+    """sum of the field over the group"""
+
+    function_name = 'sum'
+
+    def bind(self, record_type):
+        get = self._getter(record_type)
+        return get, (lambda state, record: state + get(record)), _identity
+
+
+class Min(Aggregator):
+    """minimum of the field over the group"""
+
+    function_name = 'min'
+
+    def bind(self, record_type):
+        get = self._getter(record_type)
+        return get, (lambda state, record: min(state, get(record))), _identity
+
+
+class Max(Aggregator):
+    """maximum of the field over the group"""
+
+    function_name = 'max'
+
+    def bind(self, record_type):
+        get = self._getter(record_type)
+        return get, (lambda state, record: max(state, get(record))), _identity
+
+
+class Mean(Aggregator):
+    """arithmetic mean of the field over the group"""
+
+    function_name = 'mean'
+
+    def bind(self, record_type):
+        get = self._getter(record_type)
+        return ((lambda record: (get(record), 1)),
+                (lambda state, record: (state[0] + get(record), state[1] + 1)),
+                (lambda state: state[0] / float(state[1])))
+
+
+class First(Aggregator):
+    """value of the field in the first record of the group"""
+
+    function_name = 'first'
+
+    def bind(self, record_type):
+        return self._getter(record_type), (lambda state, record: state), \
+               _identity
+
+
+class Last(Aggregator):
+    """value of the field in the last record of the group"""
+
+    function_name = 'last'
+
+    def bind(self, record_type):
+        get = self._getter(record_type)
+        return get, (lambda state, record: get(record)), _identity
+
+
+def group_by(records, field_names, *aggregators, **kwargs):
+    """
+    Group records by one or more fields and aggregate each group, e.g.
+
+        group_by(rows, 'author', Count(), Sum('size'), Max('size'))
+
+    lazily yields records of a memoized type with the fields
+    (author, count, sum_size, max_size).
+
+    :param field_names: names of the fields to group by, as a string or an
+                        iterable of strings
+    :param presorted: when True the records must already be sorted (or at
+                      least grouped) by field_names. Each group is then
+                      emitted as soon as it ends, using constant memory.
+                      Otherwise groups are collected in a dict and emitted in
+                      the order they were first seen once all of the records
+                      have been read.
+    :param record_type: type of the records, by default the type of the
+                        first record
+    :param typename: name of the result type, by default 'Group'
+    """
+    _check_unexpected_kwargs('group_by',
+                             {'presorted', 'record_type', 'typename'}, kwargs)
+    record_type, records = _peek_type(records, kwargs.get('record_type'))
+    if record_type is None:
+        return iter(())
+    field_names, positions = _parse_field_names(record_type, field_names)
+    key = itemgetter(*positions)
+    result_type = _namedtuple(
+        kwargs.get('typename', 'Group'),
+        field_names + tuple(a.name for a in aggregators))
+    bound = [a.bind(record_type) for a in aggregators]
+
+    def finish(k, states, new=tuple.__new__,
+               as_tuple=(lambda k: (k,)) if len(positions) == 1 else tuple,
+               results=[result for _, _, result in bound]):
+        return new(result_type, as_tuple(k) + tuple(
+            [result(state) for result, state in zip(results, states)]))
+
+    group = _group_presorted if kwargs.get('presorted', False) else _group_hashed
+    return group(iter(records), key, bound, finish)
+
+
+def _group_presorted(iterator, key, bound, finish):
+    """
+    Aggregate consecutive records with the same key, emitting each group as
+    soon as the next one starts.
+    """
+    starts = [start for start, _, _ in bound]
+    steps = list(enumerate(step for _, step, _ in bound))
+    for k, group in groupby(iterator, key):
+        first = next(group)
+        states = [start(first) for start in starts]
+        for record in group:
+            for index, step in steps:
+                states[index] = step(states[index], record)
+        yield finish(k, states)
+
+
+def _group_hashed(iterator, key, bound, finish):
+    """
+    Aggregate records by key in a dict, emitting the groups in the order they
+    were first seen after all of the records have been read.
+    """
+    starts = [start for start, _, _ in bound]
+    steps = list(enumerate(step for _, step, _ in bound))
+    groups = OrderedDict()
+    for record in iterator:
+        k = key(record)
+        states = groups.get(k)
+        if states is None:
+            groups[k] = [start(record) for start in starts]
+        else:
+            for index, step in steps:
+                states[index] = step(states[index], record)
+    for k, states in groups.items():
+        yield finish(k, states)
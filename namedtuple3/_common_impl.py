@@ -0,0 +1,51 @@
+# std
+from itertools import chain
+
+
+def _check_unexpected_kwargs(function_name, supported_kwargs, kwargs):
+    """
+    Raise the TypeError python raises for an unexpected keyword argument, for
+    functions taking their keyword arguments as **kwargs.
+    """
+    unexpected_kwargs = set(kwargs) - set(supported_kwargs)
+    if unexpected_kwargs:
+        fmt = "%s() got an unexpected keyword argument '%s'"
+        raise TypeError(fmt % (function_name, unexpected_kwargs.pop()))
+
+
+def _parse_field_names(record_type, field_names):
+    """
+    Normalise field_names given either as a string or as an iterable of
+    strings, in the same way as namedtuple does.
+
+    :return: tuple of (field_names, positions) where positions are the
+             indexes of the fields in record_type._fields
+    """
+    if isinstance(field_names, basestring):
+        field_names = field_names.replace(',', ' ').split()
+    field_names = tuple(map(str, field_names))
+    if not field_names:
+        raise ValueError('At least one field name is required')
+    positions = []
+    for name in field_names:
+        try:
+            positions.append(record_type._fields.index(name))
+        except ValueError:
+            raise ValueError('Unknown field name for %s: %r' %
+                             (record_type.__name__, name))
+    return field_names, tuple(positions)
+
+
+def _peek_type(records, record_type):
+    """
+    :return: (record_type, records) where record_type defaults to the type of
+             the first record, and records still includes that record.
+             record_type is None when it is not given and there are no
+             records.
+    """
+    if record_type is not None:
+        return record_type, records
+    iterator = iter(records)
+    for first in iterator:
+        return type(first), chain((first,), iterator)
+    return None, ()
@@ -0,0 +1,124 @@
+# namedtuple3
+from namedtuple3._namedtuple3_impl import namedtuple
+
+
+@namedtuple
+def Converter(convert, convert_all):
+    """functions converting one / many records from one type to another"""
+
+
+_converter_template = '''\
+def _convert(_r, {defaults_args}_new=_tuple_new, _type=_type):
+    return _new(_type, ({values},))
+
+def _convert_all(_i, {defaults_args}_new=_tuple_new, _type=_type):
+    return (_new(_type, ({values},)) for _r in _i)
+'''
+
+_cache = {}
+
+
+def _values(source, target, renames, defaults):
+    """
+    :return: list of the expression giving each field of target, either the
+             position of the field of source or its default
+    """
+    for old, new in renames.items():
+        if old not in source._fields:
+            raise ValueError('Unknown field name for %s: %r' %
+                             (source.__name__, old))
+        if new not in target._fields:
+            raise ValueError('Unknown field name for %s: %r' %
+                             (target.__name__, new))
+    for name in defaults:
+        if name not in target._fields:
+            raise ValueError('Unknown field name for %s: %r' %
+                             (target.__name__, name))
+    # the field of source giving the value of each (renamed) field of target
+    sources = {}
+    for old in source._fields:
+        new = renames.get(old, old)
+        if new in sources:
+            raise ValueError('Field %r of %s is given by both %r and %r of %s'
+                             % (new, target.__name__, sources[new], old,
+                                source.__name__))
+        if new in target._fields:
+            sources[new] = old
+    values = []
+    for name in target._fields:
+        if name in sources:
+            values.append('_r[%d]' % source._fields.index(sources[name]))
+        elif name in defaults:
+            # a factory is called for each record
+            values.append(('_d_%s()' if callable(defaults[name]) else '_d_%s')
+                          % name)
+        else:
+            raise ValueError('No value for field %r of %s, it is not a field '
+                             'of %s and has no default' %
+                             (name, target.__name__, source.__name__))
+    return values
+
+
+def converter(source, target, renames=None, defaults=None):
+    """
+    Create (or return the cached) converter of records of source to records of
+    target, for example between two versions of a type:
+
+        >>> from namedtuple3 import namedtuple, converter
+        >>> RowV1 = namedtuple('Row', 'url date author')
+        >>> RowV2 = namedtuple('Row', 'url published author size')
+        >>> convert, convert_all = converter(RowV1, RowV2,
+        ...                                  renames={'date': 'published'},
+        ...                                  defaults={'size': 0})
+        >>> convert(RowV1('a.pdf', '2016-05-15', 'pdf995'))
+        Row(url='a.pdf', published='2016-05-15', author='pdf995', size=0)
+
+    Fields of source which are not fields of target are dropped. A default
+    which is callable is a factory called for each record, e.g. list for a
+    new empty list in each record, other defaults must be hashable since the
+    same object is shared by every record. Each record is built with a single tuple expression compiled for the mapping, e.g.
+
+        _new(_type, (_r[0], _r[1], _r[2], _d_size))
+
+    and convert_all applies it in a generator expression, without a function
+    call per record.
+
+    :param renames: dict mapping names of fields of source to the names of the
+                    fields of target they become
+    :param defaults: dict mapping names of fields of target which are added to
+                     their value, or to a factory of their value
+    :return: Converter(convert, convert_all)
+    """
+    renames = dict(renames or {})
+    defaults = dict(defaults or {})
+    for name, value in defaults.items():
+        if not callable(value):
+            try:
+                hash(value)
+            except TypeError:
+                raise TypeError('Default of %r is shared by every record so it '
+                                'must be hashable, pass a factory instead: %r'
+                                % (name, value))
+    # the types of the defaults are part of the key, so that for example 0,
+    # 0.0 and False are different keys
+    key = (source, target, tuple(sorted(renames.items())),
+           tuple(sorted((name, type(value), value)
+                        for name, value in defaults.items())))
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+
+    values = _values(source, target, renames, defaults)
+    namespace = dict(('_d_' + name, value) for name, value in defaults.items())
+    namespace.update(_tuple_new=tuple.__new__, _type=target,
+                     __name__='convert_%s' % target.__name__)
+    source_code = _converter_template.format(
+        defaults_args=''.join('_d_%s=_d_%s, ' % (name, name)
+                              for name in sorted(defaults)),
+        values=', '.join(values),
+    )
+    exec(source_code, namespace)
+    result = _cache[key] = Converter(namespace['_convert'],
+                                     namespace['_convert_all'])
+    return result
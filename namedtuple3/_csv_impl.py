@@ -0,0 +1,286 @@
+# std
+from itertools import islice
+try:
+    from itertools import imap
+except ImportError:
+    imap = map
+# namedtuple3
+from namedtuple3._namedtuple3_impl import _namedtuple
+from namedtuple3._common_impl import _parse_field_names
+from namedtuple3._projection_impl import _getter
+
+
+_row_template = '''\
+def _row(_r, {formatter_args}):
+    return ({values},)
+'''
+
+_row_cache = {}
+
+
+class IncrementalReader(object):
+    """
+    Read named tuples from csv data which arrives in chunks, for example from
+    a socket or an event loop, without blocking on the rest of the input:
+
+        >>> from namedtuple3 import IncrementalReader
+        >>> reader = IncrementalReader()
+        >>> reader.feed('url,author\\na.pdf,pdf995\\nb.p')
+        [Row(url='a.pdf', author='pdf995')]
+        >>> reader.feed('df,Example Author\\n')
+        [Row(url='b.pdf', author='Example Author')]
+        >>> reader.close()
+        []
+
+    The first row is the header, giving the fields of the row type. Each call
+    to feed returns the whole batch of records completed by the chunk, so the
+    caller pays a per-chunk rather than a per-row cost.
+    """
+
+    def __init__(self, typename='Row', **fmtparams):
+        import csv
+        self._typename = typename
+        self._fmtparams = fmtparams
+        # the dialect resolved by csv, for the characters which can continue
+        # a row onto the next line
+        dialect = csv.reader([], **fmtparams).dialect
+        self._delimiter = dialect.delimiter
+        self._quotechar = (None if dialect.quoting == csv.QUOTE_NONE
+                           else dialect.quotechar)
+        self._escapechar = dialect.escapechar
+        self._doublequote = dialect.doublequote
+        self._skipinitialspace = dialect.skipinitialspace
+        self._row_type = None
+        self._partial = ''
+        self._pending = []
+        self._in_quotes = False
+
+    @property
+    def row_type(self):
+        """the type of the records, or None until the header has been read"""
+        return self._row_type
+
+    def _continues(self, line, field_start):
+        """
+        Follow the quoting of a line, in the same way as csv: a field is quoted
+        when it starts with the quote char, inside it a doubled quote char is a
+        quote, and the escape char escapes the next char.
+
+        :param field_start: whether the line starts a field, i.e. a new row
+        :return: True when the row continues onto the next line
+        """
+        quotechar = self._quotechar
+        escapechar = self._escapechar
+        if ((not quotechar or quotechar not in line) and
+                (not escapechar or escapechar not in line)):
+            # nothing in the line can change the state
+            return self._in_quotes
+        in_quotes = self._in_quotes
+        index = 0
+        length = len(line)
+        while index < length:
+            c = line[index]
+            index += 1
+            if c == escapechar:
+                index += 1
+                field_start = False
+            elif in_quotes:
+                if c == quotechar:
+                    if (self._doublequote and index < length and
+                            line[index] == quotechar):
+                        index += 1
+                    else:
+                        in_quotes = False
+            elif c == self._delimiter:
+                field_start = True
+            elif field_start and c == quotechar:
+                in_quotes = True
+                field_start = False
+            elif not (field_start and c == ' ' and self._skipinitialspace):
+                field_start = False
+        self._in_quotes = in_quotes
+        return in_quotes
+
+    def _complete_lines(self, lines, terminator='\n'):
+        """
+        :param terminator: appended to each line, as it is in a file, since csv
+                           treats a line with and without one differently
+        :return: list of the lines which complete a row, joining lines which
+                 are inside a quoted field
+        """
+        complete = []
+        pending = self._pending
+        for line in lines:
+            field_start = not pending
+            pending.append(line + terminator)
+            if not self._continues(line, field_start):
+                complete.append(''.join(pending))
+                del pending[:]
+        return complete
+
+    def _parse(self, lines):
+        import csv
+        rows = csv.reader(lines, **self._fmtparams)
+        if self._row_type is None:
+            for header in rows:
+                self._row_type = _namedtuple(self._typename, header,
+                                             rename=True)
+                break
+        make = self._row_type._make if self._row_type else None
+        return [make(row) for row in rows if row]
+
+    def feed(self, data):
+        """
+        Add a chunk of data.
+
+        :return: list of the records completed by this chunk
+        """
+        lines = (self._partial + data).split('\n')
+        self._partial = lines.pop()
+        return self._parse(self._complete_lines(lines))
+
+    def close(self):
+        """
+        Signal the end of the data.
+
+        :return: list of the records completed by the remaining data
+        """
+        lines = [self._partial] if self._partial else []
+        self._partial = ''
+        complete = self._complete_lines(lines, terminator='')
+        if self._pending:
+            import csv
+            raise csv.Error('unexpected end of data inside quoted field')
+        return self._parse(complete)
+
+
+def _compile_row(record_type, field_names, positions, formatters):
+    """
+    Compile the function converting a record to the row of values written by
+    NamedTupleWriter, with the fields in the order of field_names (at
+    positions of the record) and each value passed through its formatter (if
+    any).
+    """
+    unknown = set(formatters) - set(field_names)
+    if unknown:
+        raise ValueError('Formatter for field which is not written: %r' %
+                         unknown.pop())
+    if positions == tuple(range(len(record_type._fields))) and not formatters:
+        return None
+    if not formatters:
+        return _getter(positions)
+
+    key = (record_type, field_names,
+           tuple(sorted(formatters.items(), key=lambda item: item[0])))
+    try:
+        return _row_cache[key]
+    except KeyError:
+        pass
+    namespace = {'__name__': 'row_%s' % record_type.__name__}
+    values = []
+    for name, position in zip(field_names, positions):
+        if name in formatters:
+            namespace['_f_' + name] = formatters[name]
+            values.append('_f_%s(_r[%d])' % (name, position))
+        else:
+            values.append('_r[%d]' % position)
+    source = _row_template.format(
+        formatter_args=', '.join('_f_%s=_f_%s' % (name, name)
+                                 for name in field_names
+                                 if name in formatters),
+        values=', '.join(values),
+    )
+    exec(source, namespace)
+    row = _row_cache[key] = namespace['_row']
+    return row
+
+
+class _Chunks(list):
+    """
+    List which can be written to by csv.writer, collecting the rows so they
+    can be written to the file in one go.
+    """
+    write = list.append
+
+
+class NamedTupleWriter(object):
+    """
+    Write records of a namedtuple type as csv, with the header taken from the
+    fields of the type:
+
+        >>> from namedtuple3 import namedtuple, NamedTupleWriter
+        >>> from io import BytesIO
+        >>> Row = namedtuple('Row', 'url publication_date author')
+        >>> f = BytesIO()
+        >>> with NamedTupleWriter(f, Row, 'author url',
+        ...                       formatters={'url': str.upper},
+        ...                       lineterminator='\\n') as writer:
+        ...     writer.writeheader()
+        ...     writer.writerows([Row('a.pdf', '2016-05-15', 'pdf995')])
+        >>> print(f.getvalue())
+        author,url
+        pdf995,A.PDF
+        <BLANKLINE>
+
+    Rows are formatted into a buffer and written to the file in batches of
+    batch_size. A subset or reordering of the fields, and per field
+    formatters, are compiled into a single function for the type.
+    """
+
+    def __init__(self, f, record_type, field_names=None, formatters=None,
+                 batch_size=1000, **fmtparams):
+        """
+        :param f: file like object to write to
+        :param field_names: fields to write and their order, as a string or
+                            iterable of strings, by default all of the fields
+        :param formatters: dict mapping field names to functions converting
+                           the value of the field before it is written
+        :param batch_size: number of rows buffered before writing to f
+        :param fmtparams: passed to csv.writer
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1: %r' % batch_size)
+        if field_names is None:
+            field_names = record_type._fields
+        field_names, positions = _parse_field_names(record_type, field_names)
+        self._f = f
+        self.field_names = field_names
+        self._row = _compile_row(record_type, field_names, positions,
+                                 formatters or {})
+        self._batch_size = batch_size
+        self._chunks = _Chunks()
+        import csv
+        self._writer = csv.writer(self._chunks, **fmtparams)
+
+    def writeheader(self):
+        self._writer.writerow(self.field_names)
+
+    def writerow(self, record):
+        self._writer.writerow(record if self._row is None
+                              else self._row(record))
+        if len(self._chunks) >= self._batch_size:
+            self.flush()
+
+    def writerows(self, records):
+        row = self._row
+        writerows = self._writer.writerows
+        iterator = iter(records)
+        while True:
+            batch = list(islice(iterator, self._batch_size))
+            if not batch:
+                break
+            writerows(batch if row is None else imap(row, batch))
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered rows to the file.
+        """
+        self._f.write(''.join(self._chunks))
+        del self._chunks[:]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
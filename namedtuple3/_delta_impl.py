@@ -0,0 +1,202 @@
+_encoder_template = '''\
+def _encode(_r, _p):
+    _m = 0
+    _d = [0]
+{checks}    _d[0] = _m
+    return tuple(_d)
+'''
+
+_check_template = '''\
+    if _r[{index:d}] != _p[{index:d}]:
+        _m |= {bit:d}
+        _d.append(_r[{index:d}])
+'''
+
+_decoder_template = '''\
+def _decode(_p, _d, _new=_tuple_new, _type=_type):
+    _m, {names}= _d
+    return _new(_type, ({values},))
+'''
+
+_encoders = {}
+_decoders = {}
+
+
+def _encoder(record_type):
+    """
+    Compile the function returning the delta of a record against the previous
+    record, comparing the fields one by one, e.g. for the first field:
+
+        if _r[0] != _p[0]:
+            _m |= 1
+            _d.append(_r[0])
+    """
+    try:
+        return _encoders[record_type]
+    except KeyError:
+        pass
+    source = _encoder_template.format(checks=''.join(
+        _check_template.format(index=index, bit=1 << index)
+        for index in range(len(record_type._fields))))
+    namespace = {'__name__': 'delta_%s' % record_type.__name__}
+    exec(source, namespace)
+    encode = _encoders[record_type] = namespace['_encode']
+    return encode
+
+
+def _decoder(record_type, mask):
+    """
+    Compile the function applying a delta with the given mask to the previous
+    record, e.g. for mask 0b101 of a type with three fields:
+
+        _m, _v0, _v2, = _d
+        return _new(_type, (_v0, _p[1], _v2))
+
+    Unpacking the delta raises ValueError unless it has one value for each
+    bit set in the mask.
+    """
+    key = record_type, mask
+    try:
+        return _decoders[key]
+    except KeyError:
+        pass
+    num_fields = len(record_type._fields)
+    if not 0 <= mask < 1 << num_fields:
+        raise ValueError('Invalid mask for %s: %r' %
+                         (record_type.__name__, mask))
+    names = []
+    values = []
+    for index in range(num_fields):
+        if mask & 1 << index:
+            names.append('_v%d' % index)
+            values.append('_v%d' % index)
+        else:
+            values.append('_p[%d]' % index)
+    source = _decoder_template.format(
+        names=''.join(name + ', ' for name in names),
+        values=', '.join(values))
+    namespace = dict(_tuple_new=tuple.__new__, _type=record_type,
+                     __name__='delta_%s' % record_type.__name__)
+    exec(source, namespace)
+    decode = _decoders[key] = namespace['_decode']
+    return decode
+
+
+class DeltaEncoder(object):
+    """
+    Encode a stream of records of one type as deltas, each a tuple of a bit
+    mask of the positions of the fields which changed since the previous
+    record followed by their new values:
+
+        >>> from namedtuple3 import namedtuple, DeltaEncoder, DeltaDecoder
+        >>> Quote = namedtuple('Quote', 'symbol bid ask')
+        >>> encoder = DeltaEncoder(Quote)
+        >>> deltas = list(encoder.encode_all([Quote('ABC', 10, 11),
+        ...                                   Quote('ABC', 10, 12),
+        ...                                   Quote('ABC', 10, 12)]))
+        >>> deltas
+        [(7, 'ABC', 10, 11), (4, 12), (0,)]
+        >>> list(DeltaDecoder(Quote).decode_all(deltas))
+        [Quote(symbol='ABC', bid=10, ask=11), Quote(symbol='ABC', bid=10, ask=12), Quote(symbol='ABC', bid=10, ask=12)]
+
+    Every keyframe_interval records (and for the first record) a keyframe is
+    emitted, a delta with every field, so that a decoder can start from it.
+    Fields are compared with !=, so a value equal to the previous one is not
+    sent again.
+    """
+
+    def __init__(self, record_type, keyframe_interval=100):
+        """
+        :param keyframe_interval: number of records between keyframes, or None
+                                  for only the first record to be a keyframe
+        """
+        if keyframe_interval is not None and keyframe_interval < 1:
+            raise ValueError('keyframe_interval must be at least 1 or None: '
+                             '%r' % keyframe_interval)
+        self._encode = _encoder(record_type)
+        self._keyframe_mask = (1 << len(record_type._fields)) - 1
+        self._keyframe_interval = keyframe_interval
+        self.reset()
+
+    def reset(self):
+        """
+        Make the next record a keyframe, e.g. when a decoder joins the stream.
+        """
+        self._previous = None
+        self._count = 0
+
+    def encode(self, record):
+        """
+        :return: (mask, value...) delta of the record against the previous one
+        """
+        previous = self._previous
+        self._previous = record
+        if previous is None or self._count == self._keyframe_interval:
+            self._count = 1
+            return (self._keyframe_mask,) + tuple(record)
+        self._count += 1
+        return self._encode(record, previous)
+
+    def encode_all(self, records):
+        """
+        :return: iterator of the deltas of records
+        """
+        encode = self.encode
+        for record in records:
+            yield encode(record)
+
+
+class DeltaDecoder(object):
+    """
+    Decode the deltas of a DeltaEncoder back into records. The first delta
+    decoded must be a keyframe.
+    """
+
+    def __init__(self, record_type):
+        self._record_type = record_type
+        self._keyframe_mask = (1 << len(record_type._fields)) - 1
+        self._decoders = {}
+        self._previous = None
+
+    def decode(self, delta):
+        """
+        :param delta: (mask, value...) tuple from DeltaEncoder.encode, with
+                      one value for each bit set in the mask
+        :return: the record
+        """
+        mask = delta[0]
+        if self._previous is None and mask != self._keyframe_mask:
+            raise ValueError('Expected a keyframe, got mask %r' % mask)
+        try:
+            decode = self._decoders[mask]
+        except KeyError:
+            decode = self._decoders[mask] = _decoder(self._record_type, mask)
+        record = self._previous = decode(self._previous, delta)
+        return record
+
+    def decode_all(self, deltas):
+        """
+        :return: iterator of the records decoded from deltas, decode continues
+                 from the last of them once the iterator is exhausted or closed
+        """
+        deltas = iter(deltas)
+        if self._previous is None:
+            for delta in deltas:
+                yield self.decode(delta)
+                break
+        # the same as decode, without the method call and keyframe check and
+        # with the previous record in a local until the iterator is exhausted
+        # or closed
+        decoders = self._decoders
+        get = decoders.get
+        previous = self._previous
+        try:
+            for delta in deltas:
+                decode = get(delta[0])
+                if decode is None:
+                    decode = decoders[delta[0]] = _decoder(self._record_type,
+                                                           delta[0])
+                previous = decode(previous, delta)
+                yield previous
+        finally:
+            self._previous = previous
@@ -0,0 +1,93 @@
+# std
+try:
+    from itertools import imap
+except ImportError:
+    imap = map
+
+
+_parser_template = '''\
+def _parse(_l, _new=_tuple_new, _type=_type):
+    return _new(_type, ({values},))
+'''
+
+_cache = {}
+
+
+def _columns(record_type, widths):
+    """
+    :param widths: for each field either its width, when the field directly
+                   follows the previous one, or its (start, end) offsets
+    :return: list of (start, end) offsets of each field
+    """
+    widths = tuple(tuple(w) if isinstance(w, (tuple, list)) else w
+                   for w in widths)
+    if len(widths) != len(record_type._fields):
+        raise ValueError('Got %d widths, %s has %d fields' %
+                         (len(widths), record_type.__name__,
+                          len(record_type._fields)))
+    columns = []
+    end = 0
+    for width in widths:
+        start, end = width if isinstance(width, tuple) else (end, end + width)
+        if not 0 <= start <= end:
+            raise ValueError('Invalid column offsets: %r' % ((start, end),))
+        columns.append((start, end))
+    return columns
+
+
+def fixed_width_parser(record_type, widths, strip=True):
+    """
+    Compile a function parsing a line of fixed width text into a record of
+    record_type. The function slices every field in a single expression, e.g.
+    for widths (10, 5):
+
+        _new(_type, (_l[0:10].strip(), _l[10:15].strip()))
+
+    :param widths: for each field either its width, when the field directly
+                   follows the previous one, or its (start, end) offsets
+    :param strip: strip the padding from the values
+    """
+    columns = _columns(record_type, widths)
+    key = record_type, tuple(columns), strip
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+    source = _parser_template.format(values=', '.join(
+        '_l[%d:%d]%s' % (start, end, '.strip()' if strip else '')
+        for start, end in columns))
+    namespace = dict(_tuple_new=tuple.__new__, _type=record_type,
+                     __name__='fixed_width_%s' % record_type.__name__)
+    exec(source, namespace)
+    parse = _cache[key] = namespace['_parse']
+    return parse
+
+
+class FixedWidthReader(object):
+    """
+    Read records from a file of fixed width text, e.g.
+
+        reader = FixedWidthReader(f, Account, (10, 30, (40, 52)))
+        for account in reader:
+            ...
+
+    Lines are read in chunks of about chunk_size bytes and parsed with a
+    function compiled for the type and widths by fixed_width_parser.
+    """
+
+    def __init__(self, f, record_type, widths, strip=True,
+                 chunk_size=1 << 16):
+        self._f = f
+        self._parse = fixed_width_parser(record_type, widths, strip)
+        self._chunk_size = chunk_size
+
+    def __iter__(self):
+        parse = self._parse
+        readlines = self._f.readlines
+        chunk_size = self._chunk_size
+        while True:
+            lines = readlines(chunk_size)
+            if not lines:
+                break
+            for record in imap(parse, lines):
+                yield record
@@ -0,0 +1,119 @@
+# std
+from collections import OrderedDict
+from operator import itemgetter
+# namedtuple3
+from namedtuple3._namedtuple3_impl import _namedtuple
+from namedtuple3._common_impl import _parse_field_names, _peek_type
+from namedtuple3._projection_impl import _getter
+
+
+def _is_smaller(a, b):
+    """
+    :return: True when both a and b are sized and a has fewer items than b
+    """
+    try:
+        return len(a) < len(b)
+    except TypeError:
+        return False
+
+
+def join(left, right, field_names, how='inner', left_type=None,
+         right_type=None, typename='Joined'):
+    """
+    Hash join two iterables of records on fields they have in common.
+
+    The result records are of a memoized type with the fields of the left
+    type followed by those of the right type, except the fields joined on. Any
+    field names which then collide are renamed, as with namedtuple's rename.
+
+    The hash table is built from the smaller side when the lengths of both are
+    known, and from the right side otherwise. The other side is streamed.
+
+    :param field_names: names of the fields to join on, as a string or an
+                        iterable of strings
+    :param how: 'inner' to only yield records with a match on both sides, or
+                'left' to also yield records of the left side without a match,
+                padded with None
+    :param left_type: type of the left records, by default the type of the
+                      first left record
+    :param right_type: type of the right records, by default the type of the
+                       first right record. Required for a left join with an
+                       empty right side.
+    :param typename: name of the result type
+    """
+    if how not in ('inner', 'left'):
+        raise ValueError("how must be 'inner' or 'left': %r" % how)
+    build_left = _is_smaller(left, right)
+
+    left_type, left = _peek_type(left, left_type)
+    right_type, right = _peek_type(right, right_type)
+    if left_type is None or (right_type is None and how == 'inner'):
+        return iter(())
+    if right_type is None:
+        raise ValueError('right_type is required to left join an empty '
+                         'right side')
+
+    field_names, left_positions = _parse_field_names(left_type, field_names)
+    _, right_positions = _parse_field_names(right_type, field_names)
+    left_key = itemgetter(*left_positions)
+    right_key = itemgetter(*right_positions)
+    rest = [index for index in range(len(right_type._fields))
+            if index not in right_positions]
+    right_rest = _getter(rest) if rest else (lambda record: ())
+    result_type = _namedtuple(
+        typename,
+        left_type._fields + tuple(right_type._fields[i] for i in rest),
+        rename=True)
+
+    if build_left:
+        return _join_build_left(left, right, left_key, right_key, right_rest,
+                                (None,) * len(rest) if how == 'left' else None,
+                                result_type)
+    return _join_build_right(left, right, left_key, right_key, right_rest,
+                             (None,) * len(rest) if how == 'left' else None,
+                             result_type)
+
+
+def _join_build_right(left, right, left_key, right_key, right_rest, padding,
+                      result_type):
+    """
+    Build the hash table from the right side and stream the left side.
+    """
+    table = {}
+    for record in right:
+        table.setdefault(right_key(record), []).append(right_rest(record))
+    new = tuple.__new__
+    for record in left:
+        matches = table.get(left_key(record))
+        if matches:
+            values = tuple(record)
+            for match in matches:
+                yield new(result_type, values + match)
+        elif padding is not None:
+            yield new(result_type, tuple(record) + padding)
+
+
+def _join_build_left(left, right, left_key, right_key, right_rest, padding,
+                     result_type):
+    """
+    Build the hash table from the left side and stream the right side. For a
+    left join the left records without a match are yielded at the end.
+    """
+    table = OrderedDict()
+    for record in left:
+        table.setdefault(left_key(record), []).append(tuple(record))
+    matched = set()
+    new = tuple.__new__
+    for record in right:
+        key = right_key(record)
+        matches = table.get(key)
+        if matches:
+            matched.add(key)
+            values = right_rest(record)
+            for match in matches:
+                yield new(result_type, match + values)
+    if padding is not None:
+        for key, matches in table.items():
+            if key not in matched:
+                for match in matches:
+                    yield new(result_type, match + padding)
@@ -1,18 +1,20 @@
 # std
-import imp
-try:
-    from StringIO import StringIO
-except ImportError:
-    from io import StringIO
-import inspect
+import os
 import functools
-import pickle
-import base64
 # namedtuple3
 from _namedtuple_impl import namedtuple as _original_namedtuple
+from namedtuple3._common_impl import _check_unexpected_kwargs
 
 
-def _b32encode_no_digits(s, dumps=pickle.dumps):
+# heavier modules (pickle, base64) are imported in the functions which
+# use them, so that importing namedtuple3 and defining types stays cheap
+
+
+def _b32encode_no_digits(s, dumps=None):
+    import base64
+    if dumps is None:
+        import pickle
+        dumps = pickle.dumps
     encoded = base64.b32encode(dumps(s))
     return ''.join(
         chr(ord('a') + int(x)) if x.isdigit() else ('_' if x == '=' else x)
@@ -20,7 +22,11 @@ def _b32encode_no_digits(s, dumps=pickle.dumps):
     )
 
 
-def _b32decode_no_digits(s, loads=pickle.loads):
+def _b32decode_no_digits(s, loads=None):
+    import base64
+    if loads is None:
+        import pickle
+        loads = pickle.loads
     string_to_decode = ''.join(
         '=' if x == '_' else (str(ord(x) - ord('a')) if x.islower() else x)
         for x in s
@@ -28,37 +34,84 @@ def _b32decode_no_digits(s, loads=pickle.loads):
     return loads(base64.b32decode(string_to_decode))
 
 
+def _hashable(o):
+    """
+    :return: o when it can be hashed, otherwise its str (e.g. for lists)
+    """
+    try:
+        hash(o)
+        return o
+    except TypeError:
+        return str(o)
+
+
 def memoize(obj):
     """
-    Cache the result of a function call based on it's arguments.
+    Cache the result of a function call based on it's arguments. Arguments
+    which can be hashed are part of the key themselves, so that for example
+    two classes with the same repr are different keys, others by their str.
     """
     cache = obj.cache = {}
     @functools.wraps(obj)
     def memoizer(*args, **kwargs):
-        key = str(args) + str(kwargs)
+        key = (tuple(_hashable(arg) for arg in args),
+               tuple(sorted((name, _hashable(value))
+                            for name, value in kwargs.items())))
         if key not in cache:
             cache[key] = obj(*args, **kwargs)
         return cache[key]
     return memoizer
 
 
+# whether types with declared field types check them on construction, set
+# from the environment so that it can be switched on before types are defined
+_validation = os.environ.get('NAMEDTUPLE3_VALIDATE', '') not in ('', '0')
+
+
+def set_validation(enabled):
+    """
+    Switch validation of declared field types on or off for the types which
+    are defined from now on. Types which are already defined are unaffected,
+    so this should be called before the types are defined, e.g. at start up,
+    or set NAMEDTUPLE3_VALIDATE=1 in the environment.
+
+    When validation is off the generated __new__ is exactly the same as for a
+    type without declared field types.
+    """
+    global _validation
+    _validation = bool(enabled)
+
+
 @memoize
-def _memoized_namedtuple(name, field_names, verbose, rename, docstring):
+def _memoized_namedtuple(name, field_names, verbose, rename, docstring, types,
+                         validate):
     """
     Named tuple function which remembers the resulting type based on the
     parameters passed.
     """
-    return _original_namedtuple(name, field_names, verbose, rename, docstring)
+    if isinstance(types, frozenset):
+        types = dict(types)
+    return _original_namedtuple(name, field_names, verbose, rename, docstring,
+                                types, validate)
 
 
-def _namedtuple(name, field_names, verbose=False, rename=False, docstring=None):
+def _namedtuple(name, field_names, verbose=False, rename=False, docstring=None,
+                types=None):
+    validate = _validation and bool(types)
     # when verbose was requested we should still display the generated code
     # at the moment the best way I can do this is by regenerating the type
     # even though it has been cached...
     if verbose:
-        return _original_namedtuple(name, field_names, verbose, rename, docstring)
+        return _original_namedtuple(name, field_names, verbose, rename,
+                                    docstring, types, validate)
     else:
-        return _memoized_namedtuple(name, field_names, verbose, rename, docstring)
+        # the types are part of the memoize key, so make them hashable
+        if isinstance(types, dict):
+            types = frozenset(types.items())
+        elif types is not None:
+            types = tuple(types)
+        return _memoized_namedtuple(name, field_names, verbose, rename,
+                                    docstring, types, validate)
 
 
 def _isiterable(o):
@@ -104,48 +157,129 @@ def _is_used_as_plain_class_decorator(*args):
     ...     def __init__(self, x, y):
     ...         pass
     """
-    return len(args) == 1 and inspect.isclass(args[0])
+    return len(args) == 1 and isinstance(args[0], _class_types)
+
+
+class _OldStyleClass:
+    pass
+
+
+# new and (python 2) old style classes
+_class_types = (type, type(_OldStyleClass))
+
+_argnames_cache = {}
 
 
-def _class_decorator(cls, field_names, verbose, rename, docstring):
+def _argnames(fn):
+    """
+    :return: list of the names of the (non variable) arguments of fn, read
+             from its code object (co_varnames[:co_argcount]) and cached per
+             code object
+    """
+    code = getattr(fn, '__func__', fn).__code__
+    try:
+        return _argnames_cache[code]
+    except KeyError:
+        pass
+    argnames = _argnames_cache[code] = list(
+        code.co_varnames[:code.co_argcount])
+    return argnames
+
+
+def _annotations(fn):
+    """
+    :return: dict of the annotated types of the arguments of fn (python 3),
+             or None when there are none
+    """
+    fn = getattr(fn, '__func__', fn)
+    annotations = getattr(fn, '__annotations__', None) or {}
+    return dict((name, annotation)
+                for name, annotation in annotations.items()
+                if name != 'return') or None
+
+
+# names in the namespace of a decorated class which are not copied to the
+# generated class, either because they only describe the fields or because the
+# generated class defines them itself
+_class_decorator_excluded_names = {
+    '__init__', '__dict__', '__weakref__', '__module__', '__doc__', '__slots__',
+}
+
+
+def _class_members(cls):
+    """
+    :return: dict of the methods, properties and class attributes defined by
+             cls
+    """
+    members = dict(vars(cls))
+    for name in _class_decorator_excluded_names:
+        members.pop(name, None)
+    return members
+
+
+def _class_decorator(cls, field_names, verbose, rename, docstring, types=None):
     """
     Create a namedtuple from a decorated class.
+
+    Any methods, properties or class attributes defined on the class are
+    merged into the namespace of the generated class rather than added by
+    subclassing it, so that the result is still a direct subclass of tuple
+    with __slots__ = () and no additional level in the mro. The class can't
+    have bases (other than object), which would be lost by the merge.
     """
+    if cls.__bases__ not in ((), (object,)):
+        raise TypeError('Decorated class %s cannot have bases: %r' %
+                        (cls.__name__, cls.__bases__))
     # strip off self from the args
-    field_names = field_names or inspect.getargspec(cls.__init__).args[1:]
+    field_names = field_names or _argnames(cls.__init__)[1:]
     docstring = docstring or cls.__doc__
-    return _namedtuple(cls.__name__, field_names, verbose, rename, docstring)
-
-
-def _function_decorator(fn, field_names, verbose, rename, docstring):
+    types = types or _annotations(getattr(cls, '__init__', None))
+    result = _namedtuple(cls.__name__, field_names, verbose, rename, docstring,
+                         types)
+    members = _class_members(cls)
+    if not members:
+        return result
+    for name in result._fields:
+        if name in members:
+            raise ValueError('Class member has the same name as a field: %r'
+                             % name)
+    # the memoized type is shared, so create a new class from its namespace
+    # rather than adding the members to it
+    namespace = dict(vars(result))
+    namespace.update(members)
+    namespace['__module__'] = cls.__module__
+    return type(result)(result.__name__, result.__bases__, namespace)
+
+
+def _function_decorator(fn, field_names, verbose, rename, docstring,
+                        types=None):
     """
     Decorate a function to make it into a named tuple.
     """
-    field_names = field_names or inspect.getargspec(fn).args
+    field_names = field_names or _argnames(fn)
     docstring = docstring or fn.__doc__
-    return _namedtuple(fn.__name__, field_names, verbose, rename, docstring)
+    types = types or _annotations(fn)
+    return _namedtuple(fn.__name__, field_names, verbose, rename, docstring,
+                       types)
 
 
-def _decorator(o, field_names, verbose, rename, docstring):
+def _decorator(o, field_names, verbose, rename, docstring, types=None):
     """
     Decorate an object to make it into a named tuple, selecting the
     appropriate decorator based on the type of the object o.
     """
-    if inspect.isclass(o):
-        return _class_decorator(o, field_names, verbose, rename, docstring)
+    if isinstance(o, _class_types):
+        return _class_decorator(o, field_names, verbose, rename, docstring,
+                                types)
     else:
-        return _function_decorator(o, field_names, verbose, rename, docstring)
+        return _function_decorator(o, field_names, verbose, rename, docstring,
+                                   types)
 
 
 def _check_kwargs(**kwargs):
-    supported_kwargs = {'rename', 'verbose', 'docstring'}
-    if kwargs:
-        other_kwargs = supported_kwargs | set(kwargs.keys())
-        if other_kwargs != supported_kwargs:
-            unexpected_kwargs = other_kwargs - supported_kwargs
-            fmt = "namedtuple() got an unexpected keyword argument '%s'"
-            msg = fmt % unexpected_kwargs.pop()
-            raise TypeError(msg)
+    _check_unexpected_kwargs('namedtuple',
+                             {'rename', 'verbose', 'docstring', 'types'},
+                             kwargs)
 
 
 def namedtuple(*args, **kwargs):
@@ -165,6 +299,10 @@ def namedtuple(*args, **kwargs):
         >>> from collections import namedtuple
         >>> Point3 = namedtuple('Point3', 'x y z')
 
+    The type of each field can be declared by passing types, either as a
+    sequence in the order of the fields or as a dict, or by annotating the
+    arguments of the decorated function in python 3. When validation is
+    switched on with set_validation the types are checked on construction.
     """
     _check_kwargs(**kwargs)
 
@@ -189,8 +327,9 @@ def namedtuple(*args, **kwargs):
         verbose = kwargs.get('verbose', False)
         rename = kwargs.get('rename', False)
         docstring = kwargs.get('docstring', None)
+        types = kwargs.get('types', None)
         field_names = args[0] if args else None
 
         return functools.partial(_decorator, field_names=field_names,
                                  verbose=verbose, rename=rename,
-                                 docstring=docstring)
+                                 docstring=docstring, types=types)
@@ -12,17 +12,19 @@ class {typename}(tuple):
 
     _fields = {field_names!r}
 
+    _types = _types
+
     def __new__(_cls, {arg_list_with_defaults}):
         'Create new instance of {typename}({arg_list})'
-        return _tuple.__new__(_cls, ({arg_list}))
+{type_checks}        return _tuple.__new__(_cls, ({arg_list}))
 
     @classmethod
-    def _make(cls, iterable, new=tuple.__new__, len=len):
+    def _make(cls, iterable, new=tuple.__new__, len=len{make_type_args}):
         'Make a new {typename} object from a sequence or iterable'
         result = new(cls, iterable)
         if len(result) != {num_fields:d}:
             raise TypeError('Expected {num_fields:d} arguments, got %d' % len(result))
-        return result
+{make_type_checks}        return result
 
     def __repr__(self):
         'Return a nicely formatted representation string'
@@ -39,6 +41,24 @@ class {typename}(tuple):
             raise ValueError('Got unexpected field names: %r' % kwds.keys())
         return result
 
+    @classmethod
+    def _compile(cls, where=None, select=None, typename=None):
+        'Compile a filter / projection over an iterable of {typename} records'
+        from namedtuple3._query_impl import compile_query
+        return compile_query(cls, where, select, typename)
+
+    @classmethod
+    def _project(cls, *field_names):
+        'Return the projection of {typename} onto field_names, with converters'
+        from namedtuple3._projection_impl import project
+        return project(cls, field_names)
+
+    @classmethod
+    def _dtype(cls, *formats):
+        'Return the numpy dtype of {typename} from the type of each field, given or declared'
+        from namedtuple3._numpy_impl import dtype
+        return dtype(cls, formats)
+
     def __getnewargs__(self):
         'Return self as a plain tuple.  Used by copy and pickle.'
         return tuple(self)
@@ -54,14 +74,33 @@ class {typename}(tuple):
 
 _repr_template = '{name}=%r'
 
+# the types are globals of the generated code (__new__) or bound as default
+# arguments (_make) rather than looked up in _types on every call
+_type_check_template = '''\
+        if not isinstance({name}, _t_{name}):
+            raise TypeError('{typename}.{name} must be %r, got %r' % (_t_{name}, type({name})))
+'''
+
+_make_type_check_template = '''\
+        if not isinstance(result[{index:d}], _t_{name}):
+            raise TypeError('{typename}.{name} must be %r, got %r' % (_t_{name}, type(result[{index:d}])))
+'''
+
 _field_template = '''\
     {name} = _property(_itemgetter({index:d}), doc='Alias for field number {index:d}')
 '''
 
 def namedtuple(typename, field_names, verbose=False, rename=False,
-               docstring=None):
+               docstring=None, types=None, validate=False):
     """
     Replacement namedtuple which can be used to set defaults / docstring.
+
+    :param types: the type of each field, either as a sequence in the order of
+                  the fields, or as a dict mapping (some of) the field names to
+                  their types. Available on the generated type as _types.
+    :param validate: generate a __new__ (and _make) which raises TypeError when
+                     a field is not an instance of its type. Otherwise the
+                     generated code is exactly the same as without types.
     """
     # Validate the field names.  At the user's option, either generate an error
     # message or automatically replace the field name with a valid name.
@@ -101,6 +140,21 @@ def namedtuple(typename, field_names, verbose=False, rename=False,
             raise ValueError('Encountered duplicate field name: %r' % name)
         seen.add(name)
 
+    # Validate the field types.
+    if types is None:
+        types = {}
+    elif not isinstance(types, dict):
+        types = tuple(types)
+        if len(types) != len(field_names):
+            raise ValueError('Got %d types for %d fields' %
+                             (len(types), len(field_names)))
+        types = dict(zip(field_names, types))
+    for name in types:
+        if name not in field_names:
+            raise ValueError('Type given for unknown field name: %r' % name)
+    validated_names = [name for name in field_names if name in types] \
+        if validate else []
+
     # Fill-in the class template
     context = dict(
         typename = typename,
@@ -113,6 +167,15 @@ def namedtuple(typename, field_names, verbose=False, rename=False,
                                for index, name in enumerate(field_names)),
     )
     context.update(
+        type_checks=''.join(_type_check_template.format(typename=typename,
+                                                         name=name)
+                            for name in validated_names),
+        make_type_checks=''.join(
+            _make_type_check_template.format(typename=typename, name=name,
+                                             index=field_names.index(name))
+            for name in validated_names),
+        make_type_args=''.join(', _t_{0}=_t_{0}'.format(name)
+                               for name in validated_names),
         arg_list_with_defaults=context['arg_list'],  # TODO
         docstring=docstring or '{typename}({arg_list})'.format(**context)
     )
@@ -124,7 +187,9 @@ def namedtuple(typename, field_names, verbose=False, rename=False,
     # Execute the template string in a temporary namespace and support
     # tracing utilities by setting a value for frame.f_globals['__name__']
     namespace = dict(_itemgetter=_itemgetter, __name__='namedtuple_%s' % typename,
-                     OrderedDict=OrderedDict, _property=property, _tuple=tuple)
+                     OrderedDict=OrderedDict, _property=property, _tuple=tuple,
+                     _types=types)
+    namespace.update(('_t_' + name, types[name]) for name in validated_names)
     try:
         exec class_definition in namespace
     except SyntaxError as e:
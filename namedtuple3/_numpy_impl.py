@@ -0,0 +1,129 @@
+# std
+from itertools import repeat
+try:
+    from itertools import imap
+except ImportError:
+    imap = map
+# namedtuple3
+from namedtuple3._namedtuple3_impl import _namedtuple
+
+
+def _numpy():
+    """
+    numpy is optional, and only imported when it is used.
+
+    :return: the numpy module
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required for converting records to and '
+                          'from numpy arrays')
+    return numpy
+
+
+# numpy types of the declared field types (see namedtuple's types) which have
+# a fixed width
+_type_formats = {bool: '?', int: 'i8', float: 'f8', complex: 'c16'}
+
+
+def _declared_formats(record_type):
+    """
+    :return: tuple of the numpy type of each field from the declared field
+             types of record_type, or None unless every field has a declared
+             type with a fixed width
+    """
+    types = getattr(record_type, '_types', None) or {}
+    try:
+        return tuple(_type_formats[types[name]]
+                     for name in record_type._fields)
+    except (KeyError, TypeError):
+        return None
+
+
+def dtype(record_type, formats=None):
+    """
+    :param formats: numpy type of each field, in the order of _fields, by
+                    default derived from the declared field types (int as
+                    'i8', float as 'f8', bool as '?', complex as 'c16')
+    :return: numpy structured dtype for records of record_type
+    """
+    numpy = _numpy()
+    if not formats:
+        formats = _declared_formats(record_type)
+        if formats is None:
+            raise ValueError('Formats are required for %s, the declared types '
+                             'of its fields are %r' %
+                             (record_type.__name__,
+                              getattr(record_type, '_types', None)))
+    formats = tuple(formats)
+    if len(formats) != len(record_type._fields):
+        raise ValueError('Got %d formats, %s has %d fields' %
+                         (len(formats), record_type.__name__,
+                          len(record_type._fields)))
+    return numpy.dtype(list(zip(record_type._fields, formats)))
+
+
+def to_numpy(records, formats=None, record_type=None):
+    """
+    Build a structured array from records in one pass.
+
+    :param formats: numpy type of each field, when not given they are derived
+                    from the declared field types of the record type if they
+                    all have a fixed width, otherwise inferred from the values
+    :param record_type: type of the records, by default the type of the first
+                        record
+    :return: numpy structured array with a field for each field of the records
+    """
+    numpy = _numpy()
+    records = records if isinstance(records, list) else list(records)
+    if record_type is None:
+        if not records:
+            raise ValueError('record_type is required to convert no records')
+        record_type = type(records[0])
+    if formats is None:
+        formats = _declared_formats(record_type)
+    if formats is not None:
+        return numpy.array(records, dtype=dtype(record_type, formats))
+    array = numpy.rec.fromrecords(records, names=record_type._fields)
+    # a plain structured array rather than a recarray of numpy.record
+    return array.view(numpy.dtype(array.dtype.descr), numpy.ndarray)
+
+
+def from_numpy(array, record_type=None):
+    """
+    Read all of the rows of a structured array in one pass.
+
+    :param record_type: type of the records, by default a memoized type with
+                        the field names of the array
+    :return: list of records, with the values converted to python types
+    """
+    if record_type is None:
+        record_type = _namedtuple('Row', array.dtype.names)
+    return list(imap(tuple.__new__, repeat(record_type), array.tolist()))
+
+
+class RecordArray(object):
+    """
+    Wrapper around a structured array whose rows are returned as records,
+    while the array itself remains available for numeric work:
+
+        rows = RecordArray(to_numpy(records))
+        rows[0].size, rows.array['size'].sum()
+    """
+
+    def __init__(self, array, record_type=None):
+        self.array = array
+        self.record_type = record_type or _namedtuple('Row', array.dtype.names)
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RecordArray(self.array[index], self.record_type)
+        return tuple.__new__(self.record_type, self.array[index].item())
+
+    def __iter__(self):
+        return imap(tuple.__new__, repeat(self.record_type),
+                    self.array.tolist())
@@ -0,0 +1,65 @@
+# std
+from operator import itemgetter
+from itertools import repeat
+try:
+    from itertools import imap
+except ImportError:
+    imap = map
+# namedtuple3
+from namedtuple3._namedtuple3_impl import namedtuple, _namedtuple
+from namedtuple3._common_impl import _parse_field_names
+
+
+@namedtuple
+def Projection(type, convert, convert_all):
+    """a projected type with functions converting one / many records to it"""
+
+
+_cache = {}
+
+
+def _getter(positions):
+    """
+    :return: function taking a record and returning a plain tuple of the values
+             at positions, using a single itemgetter
+    """
+    if len(positions) == 1:
+        # a single index would return the value rather than a tuple
+        return itemgetter(slice(positions[0], positions[0] + 1))
+    return itemgetter(*positions)
+
+
+def project(record_type, field_names, typename=None):
+    """
+    Create (or return the cached) projection of record_type onto field_names.
+
+    :param field_names: names of the fields to keep, in the order they should
+                        appear in the projected type
+    :param typename: name of the projected type, by default the name of
+                     record_type with 'Projection' appended
+    :return: Projection(type, convert, convert_all)
+    """
+    if isinstance(field_names, basestring):
+        field_names = [field_names]
+    field_names = tuple(name for names in field_names
+                        for name in str(names).replace(',', ' ').split())
+    key = record_type, field_names, typename
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+
+    _, positions = _parse_field_names(record_type, field_names)
+
+    typename = typename or record_type.__name__ + 'Projection'
+    result_type = _namedtuple(typename, field_names)
+    getter = _getter(positions)
+
+    def convert(record, _new=tuple.__new__, _type=result_type, _get=getter):
+        return _new(_type, _get(record))
+
+    def convert_all(iterable):
+        return imap(tuple.__new__, repeat(result_type), imap(getter, iterable))
+
+    projection = _cache[key] = Projection(result_type, convert, convert_all)
+    return projection
@@ -0,0 +1,98 @@
+# std
+import tokenize
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+# namedtuple3
+from namedtuple3._namedtuple3_impl import _namedtuple
+
+
+_query_template = '''\
+def _query(iterable, _new=_tuple_new, _Result=_Result):
+    for _r in iterable:
+        if {where}:
+            yield {result}
+'''
+
+_cache = {}
+
+
+def _positional(expression, field_names):
+    """
+    Rewrite an expression over field names into an expression which indexes
+    the record _r directly, e.g. 'size > 10' becomes '_r[2] > 10' when size is
+    the third field. Names following a '.' (attributes) or preceding a single
+    '=' (keyword arguments) are left alone.
+    """
+    positions = dict((name, index) for index, name in enumerate(field_names))
+    tokens = [t for t in tokenize.generate_tokens(StringIO(expression).readline)
+              if t[0] not in (tokenize.NEWLINE, tokenize.ENDMARKER)]
+    result = []
+    for index, token in enumerate(tokens):
+        toktype, string = token[:2]
+        previous = tokens[index - 1][1] if index else None
+        following = tokens[index + 1][1] if index + 1 < len(tokens) else None
+        if (toktype == tokenize.NAME and string in positions
+                and previous != '.' and following != '='):
+            result.extend([(tokenize.NAME, '_r'), (tokenize.OP, '['),
+                           (tokenize.NUMBER, str(positions[string])),
+                           (tokenize.OP, ']')])
+        else:
+            result.append((toktype, string))
+    return '(%s)' % tokenize.untokenize(result).strip()
+
+
+def _parse_select(select):
+    """
+    :return: list of (name, expression) pairs from select, where each item is
+             either a field name or a (name, expression) pair
+    """
+    if isinstance(select, basestring):
+        select = select.replace(',', ' ').split()
+    return [(item, item) if isinstance(item, basestring) else tuple(item)
+            for item in select]
+
+
+def compile_query(record_type, where=None, select=None, typename=None):
+    """
+    Compile a filter and / or projection over records of record_type into a
+    function which takes an iterable of records and lazily yields the result.
+
+    :param where: expression over the field names of record_type, only records
+                  for which it is true are yielded, e.g. "size > 10"
+    :param select: field names, or (name, expression) pairs, to project each
+                   matching record to. When given the result is a memoized
+                   namedtuple type with these names as fields, otherwise the
+                   records themselves are yielded.
+    :param typename: name of the projected type, by default the name of
+                     record_type with 'Projection' appended
+    """
+    select = None if select is None else tuple(_parse_select(select))
+    key = record_type, where, select, typename
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+
+    field_names = record_type._fields
+    namespace = dict(_tuple_new=tuple.__new__, _Result=None,
+                     __name__='query_%s' % record_type.__name__)
+    if select is None:
+        result = '_r'
+    else:
+        typename = typename or record_type.__name__ + 'Projection'
+        namespace['_Result'] = _namedtuple(
+            typename, tuple(name for name, _ in select))
+        result = '_new(_Result, (%s,))' % ', '.join(
+            _positional(expression, field_names) for _, expression in select)
+    source = _query_template.format(
+        where='True' if where is None else _positional(where, field_names),
+        result=result,
+    )
+    try:
+        exec(source, namespace)
+    except SyntaxError as e:
+        raise SyntaxError(e.msg + ':\n' + source)
+    query = _cache[key] = namespace['_query']
+    return query
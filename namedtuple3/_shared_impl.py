@@ -0,0 +1,226 @@
+# std
+import os
+import struct
+
+
+_header = struct.Struct('<Q')
+
+_unpack_template = '''\
+def _unpack(_b, _o, _unpack_from=_unpack_from, _new=_tuple_new, _type=_type):
+    _v = _unpack_from(_b, _o)
+    return _new(_type, ({values},))
+'''
+
+_unpack_cache = {}
+
+
+def _shared_dir():
+    """
+    :return: directory for the shared files, /dev/shm (memory backed) when it
+             exists, otherwise the temporary directory
+    """
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    import tempfile
+    return tempfile.gettempdir()
+
+
+def _path(name):
+    """
+    :return: path of the shared file of the table called name
+    """
+    if not name or any(sep and sep in name for sep in ('/', os.sep, os.altsep)):
+        raise ValueError('Invalid shared table name: %r' % name)
+    return os.path.join(_shared_dir(), name)
+
+
+def _record_struct(record_type, format):
+    """
+    :return: struct.Struct for format, checking it packs one value per field
+    """
+    record_struct = struct.Struct(format)
+    num_values = len(record_struct.unpack(b'\0' * record_struct.size))
+    if num_values != len(record_type._fields):
+        raise ValueError('Format %r has %d values, %s has %d fields' %
+                         (format, num_values, record_type.__name__,
+                          len(record_type._fields)))
+    return record_struct
+
+
+def _value_codes(format):
+    """
+    :return: list of the format char of each value packed by a struct format,
+             e.g. ['q', 's', 'd'] for '<q16sd'
+    """
+    codes = []
+    count = ''
+    for c in format.lstrip('@=<>!'):
+        if c.isdigit():
+            count += c
+        elif not c.isspace():
+            if c in 'sp':
+                codes.append(c)
+            elif c != 'x':
+                codes.extend(c * int(count or 1))
+            count = ''
+    return codes
+
+
+def _unpacker(record_type, format, record_struct):
+    """
+    Compile the function unpacking the record at an offset of a buffer, with
+    the NUL padding stripped from string ('s') fields, e.g. for '<q16sd':
+
+        _new(_type, (_v[0], _v[1].rstrip(b'\\0'), _v[2]))
+    """
+    key = record_type, format
+    try:
+        return _unpack_cache[key]
+    except KeyError:
+        pass
+    codes = _value_codes(format)
+    if 's' not in codes:
+        unpack_from = record_struct.unpack_from
+        new = tuple.__new__
+
+        def unpack(buffer, offset):
+            return new(record_type, unpack_from(buffer, offset))
+    else:
+        source = _unpack_template.format(values=', '.join(
+            ("_v[%d].rstrip(b'\\0')" if code == 's' else '_v[%d]') % index
+            for index, code in enumerate(codes)))
+        namespace = dict(_unpack_from=record_struct.unpack_from,
+                         _tuple_new=tuple.__new__, _type=record_type,
+                         __name__='shared_%s' % record_type.__name__)
+        exec(source, namespace)
+        unpack = namespace['_unpack']
+    _unpack_cache[key] = unpack
+    return unpack
+
+
+class SharedTable(object):
+    """
+    Read-only table of fixed width records in shared memory, which processes
+    can attach to by name and read from without copying the whole table.
+
+    The records are packed with a struct format giving one value per field,
+    e.g. '<q16sd' for (id, name, price). Strings are padded with NUL bytes to
+    the declared width, as struct does, and the padding is stripped when they
+    are read (so strings ending with NUL bytes lose them).
+
+    A table is created once from an iterable of records:
+
+        table = SharedTable.create(Row, '<q16sd', rows)
+
+    and workers attach to it using its name:
+
+        table = SharedTable.attach(name, Row, '<q16sd')
+        table[10], table[100:200]
+
+    Reading a record unpacks only that record from the shared mapping. The
+    creator should call unlink when the table is no longer needed.
+    """
+
+    def __init__(self, path, record_type, format):
+        self._path = path
+        self._record_type = record_type
+        self._struct = _record_struct(record_type, format)
+        self._unpack = _unpacker(record_type, format, self._struct)
+        import mmap
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._length, = _header.unpack_from(self._mmap, 0)
+
+    @classmethod
+    def create(cls, record_type, format, records, name=None):
+        """
+        Pack records into a new shared table.
+
+        :param format: struct format of a record, one value per field
+        :param name: name of the table, by default a unique name is generated.
+                     OSError is raised if a table with the name exists.
+        """
+        record_struct = _record_struct(record_type, format)
+        if name is None:
+            import uuid
+            name = 'namedtuple3_%s' % uuid.uuid4().hex
+        path = _path(name)
+        # never replace an existing table, which processes may have mapped
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            pack = record_struct.pack
+            length = 0
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_header.pack(0))
+                for record in records:
+                    f.write(pack(*record))
+                    length += 1
+                f.seek(0)
+                f.write(_header.pack(length))
+        except:
+            os.remove(path)
+            raise
+        return cls(path, record_type, format)
+
+    @classmethod
+    def attach(cls, name, record_type, format):
+        """
+        Attach to an existing shared table by name.
+        """
+        return cls(_path(name), record_type, format)
+
+    @property
+    def name(self):
+        return os.path.basename(self._path)
+
+    @property
+    def record_type(self):
+        return self._record_type
+
+    @property
+    def nbytes(self):
+        """size in bytes of the shared records"""
+        return self._length * self._struct.size
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        unpack = self._unpack
+        size = self._struct.size
+        offset = _header.size
+        buffer = self._mmap
+        if isinstance(index, slice):
+            return [unpack(buffer, offset + i * size)
+                    for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('SharedTable index out of range')
+        return unpack(buffer, offset + index * size)
+
+    def __iter__(self):
+        unpack = self._unpack
+        size = self._struct.size
+        buffer = self._mmap
+        for offset in range(_header.size, _header.size + self.nbytes, size):
+            yield unpack(buffer, offset)
+
+    def close(self):
+        """
+        Detach from the shared table.
+        """
+        self._mmap.close()
+
+    def unlink(self):
+        """
+        Remove the shared table, processes which are attached can continue
+        to read it until they close it.
+        """
+        os.remove(self._path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
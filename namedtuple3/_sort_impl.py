@@ -0,0 +1,180 @@
+# std
+import heapq
+from itertools import islice
+from operator import itemgetter
+# namedtuple3
+from namedtuple3._common_impl import _parse_field_names
+
+
+def _pickle():
+    """
+    :return: the fastest pickle module, imported when a run is first spilled
+    """
+    try:
+        import cPickle as pickle
+    except ImportError:
+        import pickle
+    return pickle
+
+
+def _write_run(batches, tempdir):
+    """
+    Spill a sorted run to a temporary file. Only the values are written, as
+    batches of plain tuples, since the type of every record in the run is the
+    same. Each batch is pickled on its own so that neither writing nor reading
+    the run keeps a memo of all of its values.
+    """
+    import tempfile
+    pickle = _pickle()
+    run = tempfile.TemporaryFile(dir=tempdir)
+    dump = pickle.dump
+    protocol = pickle.HIGHEST_PROTOCOL
+    for batch in batches:
+        dump(batch, run, protocol)
+    run.seek(0)
+    return run
+
+
+def _record_batches(records, batch_size):
+    """
+    :return: iterator over the values of a list of records, in lists of
+             batch_size tuples
+    """
+    return ([tuple(r) for r in records[start:start + batch_size]]
+            for start in range(0, len(records), batch_size))
+
+
+def _value_batches(values, batch_size):
+    """
+    :return: iterator over an iterator of values, in lists of batch_size
+    """
+    while True:
+        batch = list(islice(values, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _read_run(run, run_index, key):
+    """
+    Read back the values of a sorted run, decorated with their key, the index
+    of the run and their position in it so that the merge is stable and never
+    compares the values themselves.
+    """
+    load = _pickle().load
+    position = 0
+    try:
+        while True:
+            for values in load(run):
+                yield key(values), run_index, position, values
+                position += 1
+    except EOFError:
+        pass
+    finally:
+        run.close()
+
+
+def _merge_values(runs, key):
+    """
+    :return: iterator over the values of the k-way merge of sorted runs
+    """
+    merged = heapq.merge(*[_read_run(run, index, key)
+                           for index, run in enumerate(runs)])
+    return (values for _, _, _, values in merged)
+
+
+def _merge_run(runs, key, batch_size, tempdir):
+    """
+    Merge sorted runs into a single run spilled to a temporary file.
+    """
+    return _write_run(_value_batches(_merge_values(runs, key), batch_size),
+                      tempdir)
+
+
+def _add_run(levels, run, key, batch_size, fan_in, tempdir):
+    """
+    Add a spilled run to the first level of runs. When a level has fan_in
+    runs they are merged into a single run of the next level, so that at most
+    fan_in runs are merged at a time and the number of open runs grows with
+    the log of the number of records. Runs of a level hold records which come
+    after those of the levels above, so merging keeps the sort stable.
+    """
+    for level in levels:
+        level.append(run)
+        if len(level) < fan_in:
+            return
+        run = _merge_run(level, key, batch_size, tempdir)
+        del level[:]
+    levels.append([run])
+
+
+def external_sort(records, field_names, record_type=None, run_size=100000,
+                  batch_size=1000, tempdir=None, fan_in=64):
+    """
+    Sort an iterable of records by one or more fields, with bounded memory.
+
+    Records are read in runs of run_size which are sorted and spilled to
+    temporary files, then the runs are merged lazily back into records of the
+    original type. Like sorted, the sort is stable. When all of the records
+    fit in a single run nothing is written to disk.
+
+    At most fan_in runs are merged at a time: once fan_in runs are spilled
+    they are merged into a longer run, and so on, so that the open temporary
+    files and the batches held while merging stay bounded.
+
+    :param field_names: names of the fields to sort by, as a string or an
+                        iterable of strings
+    :param record_type: type of the records, by default the type of the
+                        first record
+    :param run_size: maximum number of records held in memory while sorting
+    :param batch_size: number of records serialized at a time in a run
+    :param tempdir: directory for the temporary files
+    :param fan_in: maximum number of runs merged at a time
+    :return: iterator over the sorted records
+    """
+    if run_size < 1:
+        raise ValueError('run_size must be at least 1: %r' % run_size)
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1: %r' % batch_size)
+    if fan_in < 2:
+        raise ValueError('fan_in must be at least 2: %r' % fan_in)
+    iterator = iter(records)
+    first_run = list(islice(iterator, run_size))
+    if not first_run:
+        return iter(())
+    record_type = record_type or type(first_run[0])
+    _, positions = _parse_field_names(record_type, field_names)
+    key = itemgetter(*positions)
+
+    first_run.sort(key=key)
+    if len(first_run) < run_size:
+        return iter(first_run)
+
+    levels = []
+    _add_run(levels, _write_run(_record_batches(first_run, batch_size),
+                                tempdir),
+             key, batch_size, fan_in, tempdir)
+    del first_run
+    while True:
+        run = list(islice(iterator, run_size))
+        if not run:
+            break
+        run.sort(key=key)
+        _add_run(levels, _write_run(_record_batches(run, batch_size), tempdir),
+                 key, batch_size, fan_in, tempdir)
+    # the runs of the last levels, which hold the first records, come first
+    runs = [run for level in reversed(levels) for run in level]
+    while len(runs) > fan_in:
+        runs = [_merge_run(runs[start:start + fan_in], key, batch_size,
+                           tempdir)
+                for start in range(0, len(runs), fan_in)]
+    return _merge(runs, key, record_type)
+
+
+def _merge(runs, key, record_type):
+    """
+    K-way merge of sorted runs back into records of record_type.
+    """
+    new = tuple.__new__
+    for values in _merge_values(runs, key):
+        yield new(record_type, values)
@@ -0,0 +1,234 @@
+# std
+import bisect
+from collections import OrderedDict
+from operator import itemgetter
+# namedtuple3
+from namedtuple3._common_impl import _parse_field_names
+
+
+class _HashIndex(object):
+    """
+    Index answering equality lookups, mapping each key to the ids of the rows
+    which have that key in insertion order.
+    """
+
+    def __init__(self, items=()):
+        """
+        :param items: iterable of (key, rowid) pairs in increasing rowid order
+        """
+        self._buckets = {}
+        for key, rowid in items:
+            self.add(key, rowid)
+
+    def add(self, key, rowid):
+        try:
+            self._buckets[key].append(rowid)
+        except KeyError:
+            self._buckets[key] = [rowid]
+
+    def discard(self, key, rowid):
+        bucket = self._buckets[key]
+        bucket.remove(rowid)
+        if not bucket:
+            del self._buckets[key]
+
+    def lookup(self, key):
+        return self._buckets.get(key, ())
+
+
+class _SortedIndex(object):
+    """
+    Index answering equality and range lookups, keeping keys and row ids in
+    two parallel lists sorted by (key, rowid).
+    """
+
+    def __init__(self, items=()):
+        """
+        :param items: iterable of (key, rowid) pairs in increasing rowid order,
+                      sorted in a single pass (the sort is stable, so equal
+                      keys stay in rowid order)
+        """
+        items = sorted(items, key=itemgetter(0))
+        self._keys = [key for key, _ in items]
+        self._rowids = [rowid for _, rowid in items]
+
+    def add(self, key, rowid):
+        # a single insert, which is O(n), an index on existing records is built
+        # by __init__ instead
+        # row ids only ever increase so inserting to the right of equal keys
+        # keeps the lists sorted by (key, rowid)
+        index = bisect.bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._rowids.insert(index, rowid)
+
+    def discard(self, key, rowid):
+        low = bisect.bisect_left(self._keys, key)
+        high = bisect.bisect_right(self._keys, key, low)
+        index = self._rowids.index(rowid, low, high)
+        del self._keys[index]
+        del self._rowids[index]
+
+    def lookup(self, key):
+        low = bisect.bisect_left(self._keys, key)
+        high = bisect.bisect_right(self._keys, key, low)
+        return self._rowids[low:high]
+
+    def range(self, low=None, high=None):
+        start = 0 if low is None else bisect.bisect_left(self._keys, low)
+        stop = (len(self._keys) if high is None
+                else bisect.bisect_left(self._keys, high, start))
+        return self._rowids[start:stop]
+
+
+class Table(object):
+    """
+    In-memory table of records of a single namedtuple type, which can be
+    searched by field without scanning every record:
+
+        >>> from namedtuple3 import namedtuple, Table
+        >>> Row = namedtuple('Row', 'url author size')
+        >>> table = Table(Row, [Row('a.pdf', 'pdf995', 10),
+        ...                     Row('b.pdf', 'Example Author', 20),
+        ...                     Row('c.pdf', 'pdf995', 30)])
+        >>> table.create_index('author')
+        >>> table.create_index('size', sorted=True)
+        >>> table.find(author='pdf995')
+        [Row(url='a.pdf', author='pdf995', size=10), Row(url='c.pdf', author='pdf995', size=30)]
+        >>> table.range('size', 15, 35)
+        [Row(url='b.pdf', author='Example Author', size=20), Row(url='c.pdf', author='pdf995', size=30)]
+
+    Indexes are either hash indexes, answering equality lookups, or sorted
+    indexes which can also answer range lookups. Both are maintained as
+    records are inserted and deleted.
+    """
+
+    def __init__(self, record_type, records=()):
+        self._record_type = record_type
+        self._rows = OrderedDict()
+        self._next_rowid = 0
+        # maps field names -> (key getter, index)
+        self._indexes = OrderedDict()
+        self.extend(records)
+
+    @property
+    def record_type(self):
+        return self._record_type
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows.values())
+
+    def __getitem__(self, rowid):
+        return self._rows[rowid]
+
+    def create_index(self, field_names, sorted=False):
+        """
+        Index the table on one or more fields. The index is built from the
+        records already in the table and maintained from then on.
+
+        :param field_names: field names as a string or iterable of strings,
+                            as accepted by namedtuple
+        :param sorted: create a sorted index, which supports range lookups,
+                       instead of a hash index
+        """
+        field_names, positions = _parse_field_names(self._record_type,
+                                                    field_names)
+        if field_names in self._indexes:
+            raise ValueError('Index already exists on: %r' % (field_names,))
+        getter = itemgetter(*positions)
+        items = [(getter(record), rowid)
+                 for rowid, record in self._rows.items()]
+        index = _SortedIndex(items) if sorted else _HashIndex(items)
+        self._indexes[field_names] = getter, index
+
+    def drop_index(self, field_names):
+        """
+        Remove the index on the given fields.
+        """
+        field_names, _ = _parse_field_names(self._record_type, field_names)
+        del self._indexes[field_names]
+
+    def insert(self, record):
+        """
+        Add a record to the table, updating all indexes.
+
+        :return: the id of the inserted row, which can be passed to delete
+        """
+        if not isinstance(record, self._record_type):
+            record = self._record_type._make(record)
+        rowid = self._next_rowid
+        self._next_rowid += 1
+        self._rows[rowid] = record
+        for getter, index in self._indexes.values():
+            index.add(getter(record), rowid)
+        return rowid
+
+    def extend(self, records):
+        """
+        Add each record from an iterable to the table.
+
+        :return: list of the ids of the inserted rows
+        """
+        return [self.insert(record) for record in records]
+
+    def delete(self, rowid):
+        """
+        Remove a row from the table, updating all indexes.
+
+        :return: the record that was removed
+        """
+        record = self._rows.pop(rowid)
+        for getter, index in self._indexes.values():
+            index.discard(getter(record), rowid)
+        return record
+
+    def _find_index(self, field_names):
+        """
+        :return: (names, index) for an index on exactly field_names in any
+                 order, where names are the field names in index order, or
+                 (None, None) if there is no such index
+        """
+        wanted = set(field_names)
+        for names, (getter, index) in self._indexes.items():
+            if len(names) == len(wanted) and wanted.issuperset(names):
+                return names, index
+        return None, None
+
+    def find(self, **criteria):
+        """
+        Return the records whose fields equal all of the given values, e.g.
+        table.find(url='a.pdf'). An index on exactly the given fields is
+        used when one exists, otherwise every record is scanned.
+        """
+        if not criteria:
+            return list(self)
+        names, index = self._find_index(criteria)
+        if index is None:
+            field_names, positions = _parse_field_names(self._record_type,
+                                                        list(criteria))
+            getter = itemgetter(*positions)
+            key = tuple(criteria[name] for name in field_names)
+            key = key[0] if len(key) == 1 else key
+            return [r for r in self._rows.values() if getter(r) == key]
+        key = tuple(criteria[name] for name in names)
+        key = key[0] if len(key) == 1 else key
+        rows = self._rows
+        return [rows[rowid] for rowid in index.lookup(key)]
+
+    def range(self, field_names, low=None, high=None):
+        """
+        Return the records where low <= key < high, in key order, using a
+        sorted index on field_names. For an index on several fields the key
+        is a tuple of their values. A bound of None is unbounded.
+        """
+        field_names, _ = _parse_field_names(self._record_type, field_names)
+        try:
+            _, index = self._indexes[field_names]
+        except KeyError:
+            index = None
+        if not isinstance(index, _SortedIndex):
+            raise ValueError('No sorted index on: %r' % (field_names,))
+        rows = self._rows
+        return [rows[rowid] for rowid in index.range(low, high)]
@@ -0,0 +1,151 @@
+# std
+import heapq
+from datetime import datetime, timedelta
+from operator import itemgetter
+# namedtuple3
+from namedtuple3._namedtuple3_impl import _namedtuple
+from namedtuple3._common_impl import (
+    _check_unexpected_kwargs, _parse_field_names, _peek_type,
+)
+
+
+# datetime timestamps are converted to microseconds since the epoch, so that
+# windows are aligned to multiples of their size since the epoch and the
+# arithmetic is on integers (python 2 can't divide timedeltas)
+_epoch = datetime(1970, 1, 1)
+
+
+def _microseconds(delta):
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+_window_kwargs = {'lateness', 'record_type', 'typename'}
+
+
+def tumbling_window(records, field_name, size, *aggregators, **kwargs):
+    """
+    Aggregate records in consecutive, non overlapping windows of their
+    timestamp, e.g.
+
+        tumbling_window(messages, 'timestamp', timedelta(minutes=1),
+                        Count(), Max('size'))
+
+    lazily yields records of a memoized type with the fields
+    (start, end, count, max_size) for each minute with a message.
+
+    See sliding_window for the keyword arguments.
+    """
+    _check_unexpected_kwargs('tumbling_window', _window_kwargs, kwargs)
+    return _window(records, field_name, size, size, aggregators, kwargs)
+
+
+def sliding_window(records, field_name, size, slide, *aggregators, **kwargs):
+    """
+    Aggregate records in overlapping windows of their timestamp, a window of
+    size starting every slide, e.g.
+
+        sliding_window(messages, 'timestamp', timedelta(minutes=5),
+                       timedelta(minutes=1), Count())
+
+    counts the messages of the last five minutes, every minute.
+
+    Windows start at multiples of slide (since 1970-01-01 for datetimes) and
+    are emitted in order of their start once they are closed, windows without
+    records are not emitted. Only the open windows are kept in memory.
+
+    :param field_name: name of the timestamp field, either numbers or naive
+                       datetimes, when size and slide are timedeltas
+    :param lateness: how far behind the latest timestamp seen a record may be,
+                     0 by default. A window is closed once a timestamp of
+                     lateness past its end has been seen, later records for
+                     it are dropped.
+    :param record_type: type of the records, by default the type of the
+                        first record
+    :param typename: name of the result type, by default 'Window'
+    """
+    _check_unexpected_kwargs('sliding_window', _window_kwargs, kwargs)
+    return _window(records, field_name, size, slide, aggregators, kwargs)
+
+
+def _window(records, field_name, size, slide, aggregators, kwargs):
+    """
+    Validate the arguments of tumbling_window / sliding_window, bind the
+    aggregators and return the iterator of the windows.
+    """
+    is_datetime = isinstance(size, timedelta)
+    zero = timedelta(0) if is_datetime else 0
+    lateness = kwargs.get('lateness', zero)
+    if not size > zero:
+        raise ValueError('Window size must be positive: %r' % (size,))
+    if not slide > zero:
+        raise ValueError('Window slide must be positive: %r' % (slide,))
+    if lateness < zero:
+        raise ValueError('Lateness cannot be negative: %r' % (lateness,))
+
+    record_type, records = _peek_type(records, kwargs.get('record_type'))
+    if record_type is None:
+        return iter(())
+    _, positions = _parse_field_names(record_type, field_name)
+    if len(positions) != 1:
+        raise ValueError('Expected a single timestamp field: %r' %
+                         (field_name,))
+    get = itemgetter(*positions)
+    result_type = _namedtuple(
+        kwargs.get('typename', 'Window'),
+        ('start', 'end') + tuple(a.name for a in aggregators))
+    bound = [a.bind(record_type) for a in aggregators]
+
+    if is_datetime:
+        size, slide, lateness = [_microseconds(x)
+                                 for x in (size, slide, lateness)]
+        timestamp = lambda record: _microseconds(get(record) - _epoch)
+        to_timestamp = lambda units: _epoch + timedelta(microseconds=units)
+    else:
+        timestamp = get
+        to_timestamp = None
+
+    def finish(begin, states, new=tuple.__new__,
+               results=[result for _, _, result in bound]):
+        end = begin + size
+        if to_timestamp is not None:
+            begin, end = to_timestamp(begin), to_timestamp(end)
+        return new(result_type, (begin, end) + tuple(
+            [result(state) for result, state in zip(results, states)]))
+
+    return _windows(iter(records), timestamp, size, slide, lateness, bound,
+                    finish)
+
+
+def _windows(iterator, timestamp, size, slide, lateness, bound, finish):
+    """
+    Aggregate records in the windows [begin, begin + size) containing their
+    timestamp, with begin a multiple of slide, emitting each window once the
+    watermark (the latest timestamp seen less lateness) has passed its end.
+    """
+    starts = [start for start, _, _ in bound]
+    steps = list(enumerate(step for _, step, _ in bound))
+    windows = {}  # states of the open windows by their start
+    heap = []  # starts of the open windows
+    watermark = None
+    for record in iterator:
+        t = timestamp(record)
+        if watermark is None or t - lateness > watermark:
+            watermark = t - lateness
+            while heap and heap[0] + size <= watermark:
+                begin = heapq.heappop(heap)
+                yield finish(begin, windows.pop(begin))
+        begin = t // slide * slide
+        # the window is closed, or the record is late for it, when its end
+        # has been passed by the watermark
+        while begin + size > t and begin + size > watermark:
+            states = windows.get(begin)
+            if states is None:
+                windows[begin] = [start(record) for start in starts]
+                heapq.heappush(heap, begin)
+            else:
+                for index, step in steps:
+                    states[index] = step(states[index], record)
+            begin -= slide
+    while heap:
+        begin = heapq.heappop(heap)
+        yield finish(begin, windows.pop(begin))
@@ -0,0 +1,81 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import (
+    namedtuple, group_by, Count, Sum, Min, Max, Mean, First, Last,
+)
+
+
+@namedtuple
+def Row(url, author, size):
+    """a row of some csv file"""
+
+
+rows = [
+    Row('a.pdf', 'pdf995', 10),
+    Row('b.pdf', 'Example Author', 20),
+    Row('c.pdf', 'pdf995', 30),
+    Row('a.pdf', 'Example Author', 40),
+    Row('a.pdf', 'pdf995', 50),
+]
+
+
+@pytest.mark.parametrize("presorted", [False, True])
+def test_group_by(presorted):
+
+    records = sorted(rows, key=lambda r: r.author) if presorted else rows
+    result = list(group_by(records, 'author', Count(), Sum('size'),
+                           Min('size'), Max('size'), Mean('size'),
+                           First('url'), Last('url'), presorted=presorted))
+
+    assert type(result[0])._fields == (
+        'author', 'count', 'sum_size', 'min_size', 'max_size', 'mean_size',
+        'first_url', 'last_url')
+    assert sorted(result) == [
+        ('Example Author', 2, 60, 20, 40, 30.0, 'b.pdf', 'a.pdf'),
+        ('pdf995', 3, 90, 10, 50, 30.0, 'a.pdf', 'a.pdf'),
+    ]
+
+
+def test_group_by_hashed_keeps_first_seen_order():
+
+    result = group_by(rows, 'url', Count())
+
+    assert [(g.url, g.count) for g in result] == [
+        ('a.pdf', 3), ('b.pdf', 1), ('c.pdf', 1)]
+
+
+def test_group_by_presorted_emits_runs():
+
+    result = group_by(rows, 'url', Count(name='n'), presorted=True)
+
+    assert [(g.url, g.n) for g in result] == [
+        ('a.pdf', 1), ('b.pdf', 1), ('c.pdf', 1), ('a.pdf', 2)]
+
+
+def test_group_by_multiple_fields():
+
+    result = group_by(rows, 'url, author', Sum('size'), typename='Total')
+
+    assert list(result)[:2] == [('a.pdf', 'pdf995', 60),
+                                ('b.pdf', 'Example Author', 20)]
+
+
+def test_group_by_empty():
+
+    assert list(group_by(iter([]), 'url', Count())) == []
+
+
+def test_group_by_unknown_field():
+
+    with pytest.raises(ValueError):
+        group_by(rows, 'title', Count())
+
+    with pytest.raises(ValueError):
+        group_by(rows, 'url', Sum('title'))
+
+
+def test_group_by_unexpected_kwarg():
+
+    with pytest.raises(TypeError):
+        group_by(rows, 'url', Count(), sorted=True)
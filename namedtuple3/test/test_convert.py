@@ -0,0 +1,100 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, converter
+
+
+RowV1 = namedtuple('Row', 'url publication_date author')
+RowV2 = namedtuple('Row', 'url published author size')
+
+rows = [
+    RowV1('http://www.pdf995.com/samples/pdf.pdf', '2016-05-15', 'pdf995'),
+    RowV1('http://www.publishers.org.uk/2091.pdf', '2016-06-03', 'Example Author'),
+]
+
+
+def test_converter():
+
+    convert, convert_all = converter(RowV1, RowV2,
+                                     renames={'publication_date': 'published'},
+                                     defaults={'size': 0})
+
+    assert convert(rows[0]) == RowV2(rows[0].url, '2016-05-15', 'pdf995', 0)
+    assert type(convert(rows[0])) is RowV2
+    assert list(convert_all(rows)) == [
+        RowV2(r.url, r.publication_date, r.author, 0) for r in rows]
+
+
+def test_converter_drop():
+
+    Narrow = namedtuple('Narrow', 'author url')
+    convert, convert_all = converter(RowV1, Narrow)
+
+    assert convert(rows[0]) == Narrow('pdf995', rows[0].url)
+    assert list(convert_all(rows)) == [(r.author, r.url) for r in rows]
+
+
+def test_converter_swap():
+
+    Swapped = namedtuple('Swapped', 'url publication_date author')
+    convert, _ = converter(RowV1, Swapped,
+                           renames={'publication_date': 'author',
+                                    'author': 'publication_date'})
+
+    assert convert(rows[0]) == Swapped(rows[0].url, 'pdf995', '2016-05-15')
+
+
+def test_converter_is_cached():
+
+    assert converter(RowV1, RowV2, {'publication_date': 'published'},
+                     {'size': 0}) is \
+        converter(RowV1, RowV2, {'publication_date': 'published'},
+                  {'size': 0})
+
+
+def test_converter_is_cached_by_type_of_defaults():
+
+    convert, _ = converter(RowV1, RowV2, {'publication_date': 'published'},
+                           {'size': 0})
+    convert_float, _ = converter(RowV1, RowV2,
+                                 {'publication_date': 'published'},
+                                 {'size': 0.0})
+
+    assert type(convert(rows[0]).size) is int
+    assert type(convert_float(rows[0]).size) is float
+
+
+def test_converter_default_factory():
+
+    Tagged = namedtuple('Tagged', 'url tags')
+    convert, convert_all = converter(RowV1, Tagged, defaults={'tags': list})
+
+    assert convert(rows[0]) == Tagged(rows[0].url, [])
+    tagged = list(convert_all(rows))
+    tagged[0].tags.append('pdf')
+    assert tagged[1].tags == []
+
+
+def test_converter_unhashable_default():
+
+    Tagged = namedtuple('Tagged', 'url tags')
+
+    with pytest.raises(TypeError):
+        converter(RowV1, Tagged, defaults={'tags': []})
+
+
+@pytest.mark.parametrize("renames, defaults", [
+    ({}, {}),  # no value for published and size
+    ({'publication_date': 'published'}, {}),  # no value for size
+    ({'date': 'published'}, {'size': 0}),
+    ({'publication_date': 'date'}, {'size': 0}),
+    ({'publication_date': 'published'}, {'size': 0, 'weight': 0}),
+    # two fields of RowV1 renamed to published
+    ({'publication_date': 'published', 'author': 'published'}, {'size': 0}),
+    # url renamed to author, which is also given by author
+    ({'publication_date': 'published', 'url': 'author'}, {'size': 0}),
+])
+def test_converter_invalid(renames, defaults):
+
+    with pytest.raises(ValueError):
+        converter(RowV1, RowV2, renames, defaults)
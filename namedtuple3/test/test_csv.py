@@ -0,0 +1,155 @@
+# std
+import csv
+# six
+from six import StringIO
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, IncrementalReader, NamedTupleWriter
+
+
+data = (
+    'url,publication_date,author\n'
+    'http://www.pdf995.com/samples/pdf.pdf,2016-05-15,pdf995\n'
+    'http://www.publishers.org.uk/2091.pdf,2016-06-03,"Example\n""Author"""\n'
+    '\n'
+    'http://www.pdf995.com/samples/pdf.pdf,2016-01-15,pdf995'
+)
+
+expected = [
+    ('http://www.pdf995.com/samples/pdf.pdf', '2016-05-15', 'pdf995'),
+    ('http://www.publishers.org.uk/2091.pdf', '2016-06-03',
+     'Example\n"Author"'),
+    ('http://www.pdf995.com/samples/pdf.pdf', '2016-01-15', 'pdf995'),
+]
+
+
+# incremental reader ###########################################################
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 50, len(data)])
+def test_incremental_reader(chunk_size):
+
+    reader = IncrementalReader()
+    records = []
+    for start in range(0, len(data), chunk_size):
+        records.extend(reader.feed(data[start:start + chunk_size]))
+    records.extend(reader.close())
+
+    assert records == expected
+    assert reader.row_type._fields == ('url', 'publication_date', 'author')
+    assert all(type(r) is reader.row_type for r in records)
+
+
+def test_incremental_reader_batches():
+
+    reader = IncrementalReader(typename='Document')
+
+    assert reader.feed(data[:100]) == expected[:1]
+    assert reader.row_type.__name__ == 'Document'
+
+
+def test_incremental_reader_unterminated_quote():
+
+    reader = IncrementalReader()
+    reader.feed('a,b\n1,"2\n')
+
+    with pytest.raises(csv.Error):
+        reader.close()
+
+
+def _feed(reader, data, chunk_size):
+    records = []
+    for start in range(0, len(data), chunk_size):
+        records.extend(reader.feed(data[start:start + chunk_size]))
+    records.extend(reader.close())
+    return records
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 100])
+@pytest.mark.parametrize("data, fmtparams", [
+    # quote chars which don't start a field don't quote it
+    ('name,height\nbob,5\'11"\nann,"5\'2""\n"\n', {}),
+    ('name,height\nbob,5\'11"\nann,5\'2"\n', {'quoting': csv.QUOTE_NONE}),
+    ('name,height\nbob,"5\'11\\"\nx"\nann,5\\\nx,2\n', {'escapechar': '\\'}),
+    ('name;height\nbob; "5\n11"\n', {'delimiter': ';',
+                                      'skipinitialspace': True}),
+])
+def test_incremental_reader_quoting(data, fmtparams, chunk_size):
+
+    reader = IncrementalReader(**fmtparams)
+    records = _feed(reader, data, chunk_size)
+
+    assert records == [tuple(row) for row in
+                       list(csv.reader(StringIO(data), **fmtparams))[1:]]
+
+
+# writer #######################################################################
+
+@namedtuple
+def Row(url, publication_date, author):
+    """a row of some csv file"""
+
+
+rows = [Row(*values) for values in expected]
+
+
+def _write(records, *args, **kwargs):
+    f = StringIO()
+    with NamedTupleWriter(f, Row, *args, **kwargs) as writer:
+        writer.writeheader()
+        writer.writerows(records)
+    return f.getvalue()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_writer_round_trip(batch_size):
+
+    written = _write(iter(rows), batch_size=batch_size)
+
+    reader = IncrementalReader()
+    assert reader.feed(written) + reader.close() == rows
+
+
+@pytest.mark.parametrize("field_names", ['author url', ['author', 'url']])
+def test_writer_field_names(field_names):
+
+    assert _write(rows[:1], field_names, lineterminator='\n') == (
+        'author,url\n'
+        'pdf995,http://www.pdf995.com/samples/pdf.pdf\n'
+    )
+
+
+def test_writer_formatters():
+
+    written = _write(rows[:1], 'publication_date, author',
+                     formatters={'publication_date': lambda d: d[:4]},
+                     lineterminator='\n')
+
+    assert written == 'publication_date,author\n2016,pdf995\n'
+
+
+def test_writer_writerow_buffers():
+
+    f = StringIO()
+    writer = NamedTupleWriter(f, Row, 'author', batch_size=2)
+    writer.writerow(rows[0])
+    assert f.getvalue() == ''
+    writer.writerow(rows[1])
+    assert f.getvalue().count('\n') == 3   # includes the quoted newline
+
+
+@pytest.mark.parametrize("field_names,formatters", [
+    ('title', None),
+    ('url', {'author': str}),
+])
+def test_writer_invalid(field_names, formatters):
+
+    with pytest.raises(ValueError):
+        NamedTupleWriter(StringIO(), Row, field_names, formatters)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_writer_invalid_batch_size(batch_size):
+
+    with pytest.raises(ValueError):
+        NamedTupleWriter(StringIO(), Row, batch_size=batch_size)
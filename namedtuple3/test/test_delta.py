@@ -0,0 +1,111 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, DeltaEncoder, DeltaDecoder
+
+
+@namedtuple
+def Status(host, state, load):
+    """the status of some host"""
+
+
+statuses = [
+    Status('a', 'up', 1),
+    Status('a', 'up', 1),
+    Status('a', 'up', 2),
+    Status('a', 'down', 0),
+    Status('b', 'down', 0),
+    Status('b', 'up', 3),
+]
+
+
+def test_encode():
+
+    encoder = DeltaEncoder(Status)
+
+    assert list(encoder.encode_all(statuses)) == [
+        (0b111, 'a', 'up', 1),
+        (0,),
+        (0b100, 2),
+        (0b110, 'down', 0),
+        (0b001, 'b'),
+        (0b110, 'up', 3),
+    ]
+
+
+@pytest.mark.parametrize("keyframe_interval", [None, 1, 2, 4, 100])
+def test_decode(keyframe_interval):
+
+    encoder = DeltaEncoder(Status, keyframe_interval)
+    decoded = list(DeltaDecoder(Status).decode_all(encoder.encode_all(statuses)))
+
+    assert decoded == statuses
+    assert all(type(status) is Status for status in decoded)
+
+
+def test_decode_after_decode_all():
+
+    encoder = DeltaEncoder(Status)
+    decoder = DeltaDecoder(Status)
+
+    deltas = encoder.encode_all(statuses)
+    assert list(decoder.decode_all([next(deltas), next(deltas)])) == \
+        statuses[:2]
+    assert [decoder.decode(delta) for delta in deltas] == statuses[2:]
+
+
+@pytest.mark.parametrize("keyframe_interval", [0, -1])
+def test_invalid_keyframe_interval(keyframe_interval):
+
+    with pytest.raises(ValueError):
+        DeltaEncoder(Status, keyframe_interval)
+
+
+def test_keyframes():
+
+    encoder = DeltaEncoder(Status, keyframe_interval=2)
+    masks = [delta[0] for delta in encoder.encode_all(statuses)]
+
+    assert masks == [0b111, 0, 0b111, 0b110, 0b111, 0b110]
+
+
+def test_reset():
+
+    encoder = DeltaEncoder(Status)
+    encoder.encode(statuses[0])
+    encoder.reset()
+
+    # a decoder joining the stream starts from the keyframe after the reset
+    delta = encoder.encode(statuses[1])
+    assert delta == (0b111, 'a', 'up', 1)
+    assert DeltaDecoder(Status).decode(delta) == statuses[1]
+
+
+def test_decode_without_keyframe():
+
+    with pytest.raises(ValueError):
+        DeltaDecoder(Status).decode((0b100, 2))
+
+
+def test_decode_invalid_mask():
+
+    decoder = DeltaDecoder(Status)
+    decoder.decode((0b111, 'a', 'up', 1))
+
+    with pytest.raises(ValueError):
+        decoder.decode((0b1000, 2))
+
+
+@pytest.mark.parametrize("delta", [
+    (0b100, 2, 3),  # an extra value
+    (0b110, 'down'),  # a missing value
+])
+def test_decode_invalid_number_of_values(delta):
+
+    decoder = DeltaDecoder(Status)
+    decoder.decode((0b111, 'a', 'up', 1))
+
+    with pytest.raises(ValueError):
+        decoder.decode(delta)
+    with pytest.raises(ValueError):
+        list(decoder.decode_all([delta]))
@@ -0,0 +1,62 @@
+# six
+from six import StringIO
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, fixed_width_parser, FixedWidthReader
+
+
+@namedtuple
+def Account(number, name, balance):
+    """an account from some mainframe export"""
+
+
+lines = [
+    '0000000001Joe Bloggs          000000012.50\n',
+    '0000000002Example Author      000000100.00\n',
+    '0000000003pdf995              000000000.99\n',
+]
+
+
+@pytest.mark.parametrize("widths", [
+    (10, 20, 12),
+    ((0, 10), (10, 30), (30, 42)),
+    (10, 20, (30, 42)),
+])
+def test_fixed_width_parser(widths):
+
+    parse = fixed_width_parser(Account, widths)
+
+    assert parse(lines[1]) == ('0000000002', 'Example Author', '000000100.00')
+    assert type(parse(lines[1])) is Account
+
+
+def test_fixed_width_parser_no_strip():
+
+    parse = fixed_width_parser(Account, ((10, 16), (0, 10), (35, 42)),
+                               strip=False)
+
+    assert parse(lines[0]) == ('Joe Bl', '0000000001', '0012.50')
+
+
+def test_fixed_width_parser_is_cached():
+
+    assert fixed_width_parser(Account, (10, 20, 12)) is \
+        fixed_width_parser(Account, [(0, 10), (10, 30), (30, 42)])
+
+
+@pytest.mark.parametrize("widths", [(10, 20), (10, 20, (40, 30))])
+def test_fixed_width_parser_invalid(widths):
+
+    with pytest.raises(ValueError):
+        fixed_width_parser(Account, widths)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 50, 1 << 16])
+def test_fixed_width_reader(chunk_size):
+
+    reader = FixedWidthReader(StringIO(''.join(lines)), Account, (10, 20, 12),
+                              chunk_size=chunk_size)
+
+    assert [a.name for a in reader] == ['Joe Bloggs', 'Example Author',
+                                        'pdf995']
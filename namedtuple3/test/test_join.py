@@ -0,0 +1,80 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, join
+
+
+@namedtuple
+def Document(url, author, size):
+    """a document in some feed"""
+
+
+@namedtuple
+def Author(author, email, size):
+    """an author in some other feed"""
+
+
+documents = [
+    Document('a.pdf', 'pdf995', 10),
+    Document('b.pdf', 'Example Author', 20),
+    Document('c.pdf', 'Nobody', 30),
+]
+
+authors = [
+    Author('pdf995', 'pdf@995.com', 1),
+    Author('Example Author', 'example@example.com', 2),
+    Author('pdf995', 'pdf995@example.com', 3),
+]
+
+
+@pytest.mark.parametrize("left,right", [
+    (documents, authors),               # build right, same size
+    (documents[:2], authors),           # build left
+    (iter(documents), iter(authors)),   # build right, unsized
+])
+def test_join_inner(left, right):
+
+    result = list(join(left, right, 'author'))
+
+    assert sorted(result) == [
+        ('a.pdf', 'pdf995', 10, 'pdf995@example.com', 3),
+        ('a.pdf', 'pdf995', 10, 'pdf@995.com', 1),
+        ('b.pdf', 'Example Author', 20, 'example@example.com', 2),
+    ]
+    # the colliding size field is renamed
+    assert type(result[0])._fields == ('url', 'author', 'size', 'email', '_4')
+
+
+@pytest.mark.parametrize("left", [documents, documents + documents])
+def test_join_left(left):
+
+    result = list(join(left, authors[:1], 'author', how='left'))
+
+    assert sorted(result) == sorted(
+        [('a.pdf', 'pdf995', 10, 'pdf@995.com', 1),
+         ('b.pdf', 'Example Author', 20, None, None),
+         ('c.pdf', 'Nobody', 30, None, None)] * (len(left) // 3))
+
+
+def test_join_left_empty_right():
+
+    result = list(join(documents, [], 'author', how='left', right_type=Author))
+    assert result[2] == ('c.pdf', 'Nobody', 30, None, None)
+
+    with pytest.raises(ValueError):
+        join(documents, [], 'author', how='left')
+
+
+def test_join_empty():
+
+    assert list(join([], authors, 'author')) == []
+    assert list(join(documents, [], 'author')) == []
+
+
+def test_join_invalid():
+
+    with pytest.raises(ValueError):
+        join(documents, authors, 'email')
+
+    with pytest.raises(ValueError):
+        join(documents, authors, 'author', how='outer')
@@ -4,8 +4,11 @@ import contextlib
 import itertools
 import datetime
 import socket
+import os
 import uuid
 import sys
+import inspect
+import subprocess
 # dill
 import dill
 # six
@@ -16,7 +19,8 @@ import mock
 import pytest
 # namedtuple_decorator
 from namedtuple3._namedtuple_impl import namedtuple as original_namedtuple
-from namedtuple3 import namedtuple
+import namedtuple3
+from namedtuple3 import namedtuple, set_validation
 from namedtuple3._namedtuple3_impl import (
     _is_used_as_plain_class_decorator,
     _is_used_as_plain_function_decorator,
@@ -25,6 +29,7 @@ from namedtuple3._namedtuple3_impl import (
     _check_kwargs,
     _b32encode_no_digits,
     _b32decode_no_digits,
+    _argnames,
 )
 
 
@@ -208,6 +213,29 @@ def test_check_kwargs():
     _check_kwargs(verbose=True, rename=True)
 
 
+def test_argnames():
+
+    def a(x, y, *args, **kwargs): pass
+
+    class A:
+        def __init__(self, x, y): pass
+
+    assert _argnames(a) == inspect.getargspec(a).args == ['x', 'y']
+    assert _argnames(A.__init__) == ['self', 'x', 'y']
+    # read once per function
+    assert _argnames(a) is _argnames(a)
+
+
+@pytest.mark.parametrize("module", ['inspect', 'pickle', 'base64', 'imp',
+                                    'tempfile', 'uuid', 'csv'])
+def test_import_is_lazy(module):
+    code = 'import sys, namedtuple3; print(%r in sys.modules)' % module
+    # run from the directory containing the package so that it is importable
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(namedtuple3.__file__)))
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=cwd)
+    assert output.strip() == b'False'
+
+
 words = list(''.join(x) for x in itertools.product('ab', repeat=3))
 
 
@@ -379,6 +407,84 @@ def test_class_decorator_verbose_and_rename(verbose, rename):
     verify_point3_with_docstring(Point3)
 
 
+# class decorator: members ####################################################
+
+@pytest.mark.parametrize("field_names", [None, 'x y'])
+def test_class_decorator_members(field_names):
+
+    @namedtuple(field_names)
+    class Point:
+        """an element of some set called a plane"""
+        dimensions = 2
+
+        def __init__(self, x, y):
+            pass
+
+        def scaled(self, factor):
+            return type(self)(self.x * factor, self.y * factor)
+
+        def norm(self):
+            return (self.x ** 2 + self.y ** 2) ** 0.5
+
+        @property
+        def swapped(self):
+            return Point(self.y, self.x)
+
+        @classmethod
+        def origin(cls):
+            return cls(0, 0)
+
+    point = Point(3, 4)
+    assert point.norm() == 5
+    assert point.swapped == Point(4, 3)
+    assert point.scaled(2) == Point(6, 8)
+    assert type(point.scaled(2)) is Point
+    assert Point.origin() == (0, 0)
+    assert Point.dimensions == 2
+    assert Point.__doc__ == 'an element of some set called a plane'
+
+    # merged into the generated class rather than subclassing it
+    assert Point.__mro__ == (Point, tuple, object)
+    assert Point.__slots__ == ()
+    with pytest.raises(AttributeError):
+        point.z = 1
+
+    # the memoized type is not modified
+    assert not hasattr(namedtuple('Point', field_names or ['x', 'y'],
+                                  docstring=Point.__doc__), 'norm')
+
+
+@pytest.mark.parametrize("field_names", [None, 'x y'])
+def test_class_decorator_bases(field_names):
+
+    class Base(object):
+        def describe(self):
+            return 'point'
+
+    # the bases would be lost when the members are merged, so super() and
+    # isinstance checks against them would not work
+    with pytest.raises(TypeError):
+        @namedtuple(field_names)
+        class Point(Base):
+            def __init__(self, x, y):
+                pass
+
+            def describe(self):
+                return super(Point, self).describe()
+
+
+@pytest.mark.parametrize("field_names", [None, 'x y'])
+def test_class_decorator_member_named_as_field(field_names):
+
+    with pytest.raises(ValueError):
+        @namedtuple(field_names)
+        class Point(object):
+            x = 5
+
+            def __init__(self, x, y):
+                pass
+
+
 # function decorator: dynamic field names ######################################
 
 def test_function_decorator_dynamic_field_names():
@@ -669,3 +775,96 @@ def test_default():
         process=lambda: threading.current_thread().name,
         timestamp=datetime.datetime.now,
     ) : 'message for the logging system'
+
+
+# types ########################################################################
+
+@contextlib.contextmanager
+def validation(enabled):
+    set_validation(enabled)
+    try:
+        yield
+    finally:
+        set_validation(False)
+
+
+@pytest.mark.parametrize("types", [
+    (int, int, (int, float)),
+    {'x': int, 'y': int, 'z': (int, float)},
+])
+def test_types_validation(types):
+
+    with validation(True):
+        Point3 = namedtuple('Point3', 'x y z', types=types)
+
+    verify_point3(Point3)
+    assert Point3(1, 2, 3.5) == (1, 2, 3.5)
+    assert Point3._types['x'] is int
+
+    with pytest.raises(TypeError):
+        Point3(1, 2, '3')
+
+    with pytest.raises(TypeError):
+        Point3._make([1, '2', 3])
+
+    with pytest.raises(TypeError):
+        Point3(1, 2, 3)._replace(y='2')
+
+
+def test_types_no_validation():
+
+    Point3 = namedtuple('Point3', 'x y z', types={'x': int})
+
+    verify_point3(Point3)
+    assert Point3('1', 2, 3) == ('1', 2, 3)
+    assert Point3._types == {'x': int}
+
+
+def test_types_decorator():
+
+    with validation(True):
+        @namedtuple(types={'x': int})
+        def Point3(x, y, z):
+            """an element of some set called a space"""
+
+    verify_point3_with_docstring(Point3)
+    with pytest.raises(TypeError):
+        Point3('1', 2, 3)
+
+
+def test_types_validation_is_memoized_separately():
+
+    Point3 = namedtuple('Point3', 'x y z', types={'x': int})
+    with validation(True):
+        ValidatedPoint3 = namedtuple('Point3', 'x y z', types={'x': int})
+
+    assert Point3 is not ValidatedPoint3
+    assert Point3 is namedtuple('Point3', 'x y z', types={'x': int})
+
+
+def _money_type():
+    class Money(object):
+        pass
+    return Money
+
+
+def test_types_memoized_by_type_not_repr():
+
+    MoneyA, MoneyB = _money_type(), _money_type()
+    assert repr(MoneyA) == repr(MoneyB)
+
+    with validation(True):
+        PA = namedtuple('P', 'amount', types={'amount': MoneyA})
+        PB = namedtuple('P', 'amount', types={'amount': MoneyB})
+        assert PA is namedtuple('P', 'amount', types={'amount': MoneyA})
+
+    assert PA is not PB
+    assert PB._types == {'amount': MoneyB}
+    PB(MoneyB())
+
+
+@pytest.mark.parametrize("types", [(int,), {'w': int}])
+def test_types_invalid(types):
+
+    with pytest.raises(ValueError):
+        namedtuple('Point3', 'x y z', types=types)
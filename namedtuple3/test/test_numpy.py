@@ -0,0 +1,75 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, to_numpy, from_numpy, RecordArray
+
+
+numpy = pytest.importorskip('numpy')
+
+
+@namedtuple
+def Sample(name, size, weight):
+    """a measurement of something"""
+
+
+samples = [Sample('a', 1, 0.5), Sample('bb', 2, 1.5), Sample('ccc', 3, 2.5)]
+
+
+def test_dtype():
+
+    dtype = Sample._dtype('S4', 'i8', 'f8')
+
+    assert dtype.names == ('name', 'size', 'weight')
+    assert dtype['size'] == numpy.dtype('i8')
+
+    with pytest.raises(ValueError):
+        Sample._dtype('S4', 'i8')
+
+
+def test_dtype_from_declared_types():
+
+    Measure = namedtuple('Measure', 'size weight valid',
+                         types=(int, float, bool))
+
+    dtype = Measure._dtype()
+
+    assert dtype.names == Measure._fields
+    assert [dtype[name] for name in Measure._fields] == [
+        numpy.dtype('i8'), numpy.dtype('f8'), numpy.dtype('?')]
+    assert to_numpy([Measure(1, 0.5, True)]).dtype == dtype
+
+    # no declared types, or a type without a fixed width
+    with pytest.raises(ValueError):
+        Sample._dtype()
+    with pytest.raises(ValueError):
+        namedtuple('Named', 'name size', types=(str, int))._dtype()
+
+
+@pytest.mark.parametrize("formats", [None, ('S4', 'i8', 'f8')])
+def test_to_numpy(formats):
+
+    array = to_numpy(iter(samples), formats, record_type=Sample)
+
+    assert array.dtype.names == Sample._fields
+    assert array['size'].sum() == 6
+    assert array['weight'].mean() == 1.5
+
+
+def test_from_numpy():
+
+    array = to_numpy(samples)
+
+    assert from_numpy(array, Sample) == samples
+    assert type(from_numpy(array, Sample)[0]) is Sample
+    assert from_numpy(array)[1]._fields == Sample._fields
+
+
+def test_record_array():
+
+    rows = RecordArray(to_numpy(samples), Sample)
+
+    assert len(rows) == 3
+    assert rows[1] == samples[1]
+    assert type(rows[1]) is Sample
+    assert list(rows[1:]) == samples[1:]
+    assert rows.array['size'].sum() == 6
@@ -0,0 +1,53 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple
+
+
+@namedtuple
+def Row(url, publication_date, author):
+    """a row of some csv file"""
+
+
+rows = [
+    Row('http://www.pdf995.com/samples/pdf.pdf', '2016-05-15', 'pdf995'),
+    Row('http://www.publishers.org.uk/2091.pdf', '2016-06-03', 'Example Author'),
+]
+
+
+@pytest.mark.parametrize("field_names", [
+    ('author', 'url'),
+    ('author url',),
+    ('author, url',),
+])
+def test_project(field_names):
+
+    Narrow, convert, convert_all = Row._project(*field_names)
+
+    assert Narrow._fields == ('author', 'url')
+    assert convert(rows[0]) == Narrow('pdf995', rows[0].url)
+    assert type(convert(rows[0])) is Narrow
+    assert list(convert_all(rows)) == [(r.author, r.url) for r in rows]
+
+
+def test_project_single_field():
+
+    Narrow, convert, convert_all = Row._project('author')
+
+    assert convert(rows[0]) == Narrow('pdf995')
+    assert list(convert_all(rows)) == [('pdf995',), ('Example Author',)]
+
+
+def test_project_is_memoized():
+
+    assert Row._project('url') is Row._project('url')
+    assert Row._project('url').type is \
+        namedtuple('RowProjection', ('url',))
+    assert type(next(Row._compile(select='url')(rows))) is \
+        Row._project('url').type
+
+
+def test_project_unknown_field():
+
+    with pytest.raises(ValueError):
+        Row._project('title')
@@ -0,0 +1,73 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple
+from namedtuple3._query_impl import _positional
+
+
+@namedtuple
+def Row(url, author, size):
+    """a row of some csv file"""
+
+
+rows = [
+    Row('http://a.org/a.pdf', 'pdf995', 10),
+    Row('https://b.org/b.pdf', 'Example Author', 20),
+    Row('http://c.org/c.pdf', 'pdf995', 30),
+]
+
+
+# positional ###################################################################
+
+@pytest.mark.parametrize("expression,expected", [
+    ("size > 10", "(_r [2 ]>10 )"),
+    ("url.startswith('http:')", "(_r [0 ].startswith ('http:'))"),
+    ("r.size", "(r .size )"),
+    ("dict(size=size)", "(dict (size =_r [2 ]))"),
+    ("size == 1", "(_r [2 ]==1 )"),
+])
+def test_positional(expression, expected):
+    assert _positional(expression, Row._fields).replace(' ', '') == \
+        expected.replace(' ', '')
+
+
+# compile ######################################################################
+
+def test_compile_where():
+
+    query = Row._compile(where="url.startswith('http:') and size > 10")
+
+    assert list(query(rows)) == [rows[2]]
+
+
+def test_compile_select():
+
+    query = Row._compile(select='url size')
+    result = list(query(rows))
+
+    assert result == [(r.url, r.size) for r in rows]
+    assert type(result[0])._fields == ('url', 'size')
+    assert type(result[0]).__name__ == 'RowProjection'
+
+
+def test_compile_where_and_select_expressions():
+
+    query = Row._compile(where="author == 'pdf995'",
+                         select=['url', ('kb', 'size * 1024')],
+                         typename='Document')
+
+    assert [r.kb for r in query(rows)] == [10240, 30720]
+
+
+def test_compile_is_cached():
+
+    assert Row._compile(where='size > 10') is Row._compile(where='size > 10')
+    projected = [next(Row._compile(select='url')(rows)),
+                 next(Row._compile(select='url', where='size')(rows))]
+    assert type(projected[0]) is type(projected[1])
+
+
+def test_compile_syntax_error():
+
+    with pytest.raises(SyntaxError):
+        Row._compile(where='size >')
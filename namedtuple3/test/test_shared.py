@@ -0,0 +1,111 @@
+# std
+import os
+import struct
+import multiprocessing
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, SharedTable
+from namedtuple3._shared_impl import _value_codes
+
+
+@namedtuple
+def Price(id, name, price):
+    """a price of some product"""
+
+
+prices = [Price(i, b'product %d' % i, i * 1.5) for i in range(100)]
+
+
+def _read_from_worker(args):
+    name, index = args
+    with SharedTable.attach(name, Price, '<q16sd') as table:
+        return tuple(table[index])
+
+
+def test_shared_table():
+
+    table = SharedTable.create(Price, '<q16sd', iter(prices))
+    try:
+        assert len(table) == 100
+        assert table.nbytes == 100 * 32
+        assert table[10] == prices[10]
+        assert type(table[10]) is Price
+        assert table[-1].id == 99
+        assert [r.id for r in table[10:20:5]] == [10, 15]
+        assert list(table) == prices
+        with pytest.raises(IndexError):
+            table[100]
+    finally:
+        table.close()
+        table.unlink()
+
+
+def test_shared_table_attach_from_other_processes():
+
+    table = SharedTable.create(Price, '<q16sd', prices)
+    pool = multiprocessing.Pool(2)
+    try:
+        result = pool.map(_read_from_worker,
+                          [(table.name, i) for i in (1, 50, 99)])
+        assert [r[0] for r in result] == [1, 50, 99]
+    finally:
+        pool.close()
+        pool.join()
+        table.close()
+        table.unlink()
+
+
+@pytest.mark.parametrize("format, codes", [
+    ('<q16sd', ['q', 's', 'd']),
+    ('=2i 4x 3s 10p', ['i', 'i', 's', 'p']),
+])
+def test_value_codes(format, codes):
+
+    assert _value_codes(format) == codes
+
+
+def test_shared_table_without_strings():
+
+    Point = namedtuple('Point', 'x y')
+    with SharedTable.create(Point, '<dd', [Point(1.0, 2.0)]) as table:
+        assert table[0] == Point(1.0, 2.0)
+        table.unlink()
+
+
+def test_shared_table_format_mismatch():
+
+    with pytest.raises(ValueError):
+        SharedTable.create(Price, '<qd', prices)
+
+
+def test_shared_table_existing_name():
+
+    table = SharedTable.create(Price, '<q16sd', prices)
+    try:
+        with pytest.raises(OSError):
+            SharedTable.create(Price, '<q16sd', prices[:1], name=table.name)
+        # the existing table is unchanged
+        assert len(table) == 100
+        assert len(SharedTable.attach(table.name, Price, '<q16sd')) == 100
+    finally:
+        table.close()
+        table.unlink()
+
+
+def test_shared_table_removed_on_error():
+
+    records = prices[:10] + [(10, b'product 10', 'not a float')]
+    name = 'namedtuple3_test_%d' % os.getpid()
+
+    with pytest.raises(struct.error):
+        SharedTable.create(Price, '<q16sd', records, name=name)
+    with pytest.raises(IOError):
+        SharedTable.attach(name, Price, '<q16sd')
+
+
+@pytest.mark.parametrize("name", ['', '../prices', 'tables/prices'])
+def test_shared_table_invalid_name(name):
+
+    with pytest.raises(ValueError):
+        SharedTable.create(Price, '<q16sd', prices, name=name)
@@ -0,0 +1,104 @@
+# std
+import random
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, external_sort
+
+
+@namedtuple
+def Row(url, publication_date, author):
+    """a row of some csv file"""
+
+
+random.seed(0)
+rows = [Row('http://%d.org' % random.randint(0, 20),
+            '2016-%02d-01' % random.randint(1, 12),
+            'author %d' % i)
+        for i in range(100)]
+
+
+@pytest.mark.parametrize("run_size", [1, 7, 100, 1000])
+def test_external_sort(run_size):
+
+    result = list(external_sort(iter(rows), 'url', run_size=run_size,
+                                batch_size=3))
+
+    assert result == sorted(rows, key=lambda r: r.url)
+    assert all(type(r) is Row for r in result)
+
+
+@pytest.mark.parametrize("fan_in", [2, 3, 64])
+def test_external_sort_fan_in(fan_in):
+
+    # a single field with many ties checks the merges keep the sort stable
+    result = list(external_sort(iter(rows), 'publication_date', run_size=1,
+                                batch_size=2, fan_in=fan_in))
+
+    assert result == sorted(rows, key=lambda r: r.publication_date)
+
+
+@pytest.mark.parametrize("run_size", [7, 1000])
+def test_external_sort_multiple_fields(run_size):
+
+    result = list(external_sort(rows, ['publication_date', 'url'],
+                                run_size=run_size))
+
+    assert result == sorted(rows, key=lambda r: (r.publication_date, r.url))
+
+
+class Tracked(object):
+    """a value counting how many instances of it are alive"""
+
+    alive = 0
+
+    def __init__(self, value):
+        self.value = value
+        Tracked.alive += 1
+
+    def __del__(self):
+        Tracked.alive -= 1
+
+    def __reduce__(self):
+        return Tracked, (self.value,)
+
+
+@pytest.mark.parametrize("num_records", [100, 1000])
+def test_external_sort_bounded_memory(num_records):
+
+    records = (Row('http://%d.org' % (i % 13), '2016-01-01', Tracked(i))
+               for i in range(num_records))
+    most_alive = 0
+
+    for row in external_sort(records, 'url', record_type=Row,
+                             run_size=num_records // 10, batch_size=5):
+        most_alive = max(most_alive, Tracked.alive)
+    del row
+
+    # one batch of each of the 10 runs is held while merging, whatever the
+    # number of records in the runs
+    assert most_alive <= 5 * 10 + 1
+    assert Tracked.alive == 0
+
+
+def test_external_sort_empty():
+
+    assert list(external_sort([], 'url')) == []
+
+
+def test_external_sort_unknown_field():
+
+    with pytest.raises(ValueError):
+        external_sort(rows, 'title')
+
+
+@pytest.mark.parametrize("kwargs", [
+    {'run_size': 0},
+    {'run_size': -1},
+    {'batch_size': 0},
+    {'fan_in': 1},
+])
+def test_external_sort_invalid_sizes(kwargs):
+
+    with pytest.raises(ValueError):
+        external_sort(rows, 'url', **kwargs)
@@ -0,0 +1,122 @@
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import namedtuple, Table
+
+
+@namedtuple
+def Row(url, author, size):
+    """a row of some csv file"""
+
+
+def _table(*index_args):
+    table = Table(Row, [
+        Row('a.pdf', 'pdf995', 10),
+        Row('b.pdf', 'Example Author', 20),
+        Row('c.pdf', 'pdf995', 30),
+        Row('a.pdf', 'Example Author', 40),
+    ])
+    for field_names, sorted in index_args:
+        table.create_index(field_names, sorted=sorted)
+    return table
+
+
+# find #########################################################################
+
+@pytest.mark.parametrize("sorted", [None, False, True])
+def test_find(sorted):
+
+    table = _table() if sorted is None else _table(('url', sorted))
+
+    assert table.find(url='a.pdf') == [Row('a.pdf', 'pdf995', 10),
+                                       Row('a.pdf', 'Example Author', 40)]
+    assert table.find(url='d.pdf') == []
+
+
+@pytest.mark.parametrize("sorted", [False, True])
+def test_find_multiple_fields(sorted):
+
+    table = _table(('url, author', sorted))
+
+    assert table.find(author='pdf995', url='a.pdf') == [
+        Row('a.pdf', 'pdf995', 10)]
+    assert table.find(author='pdf995') == [Row('a.pdf', 'pdf995', 10),
+                                           Row('c.pdf', 'pdf995', 30)]
+
+
+def test_find_unknown_field():
+
+    with pytest.raises(ValueError):
+        _table().find(title='a')
+
+
+# range ########################################################################
+
+def test_range():
+
+    table = _table(('size', True))
+
+    assert table.range('size', 20, 40) == [Row('b.pdf', 'Example Author', 20),
+                                           Row('c.pdf', 'pdf995', 30)]
+    assert table.range('size', high=20) == [Row('a.pdf', 'pdf995', 10)]
+    assert table.range('size', 35) == [Row('a.pdf', 'Example Author', 40)]
+
+
+def test_range_multiple_fields():
+
+    table = _table(('url size', True))
+
+    assert table.range('url size', ('a.pdf', 20), ('b.pdf', 0)) == [
+        Row('a.pdf', 'Example Author', 40)]
+
+
+@pytest.mark.parametrize("index_args", [(), (('size', False),)])
+def test_range_requires_sorted_index(index_args):
+
+    with pytest.raises(ValueError):
+        _table(*index_args).range('size', 0, 100)
+
+
+# insert / delete ##############################################################
+
+@pytest.mark.parametrize("sorted", [False, True])
+def test_indexes_maintained(sorted):
+
+    table = _table(('author', sorted))
+
+    rowid = table.insert(('d.pdf', 'pdf995', 50))
+    assert table[rowid] == Row('d.pdf', 'pdf995', 50)
+    assert len(table.find(author='pdf995')) == 3
+
+    table.delete(0)
+    assert table.find(author='pdf995') == [Row('c.pdf', 'pdf995', 30),
+                                           Row('d.pdf', 'pdf995', 50)]
+    assert len(table) == 4
+
+
+@pytest.mark.parametrize("sorted", [False, True])
+def test_create_index_on_populated_table(sorted):
+
+    records = [Row('%d.pdf' % i, 'author %d' % (i % 7), (i * 37) % 100)
+               for i in range(1000)]
+    built = Table(Row, records)
+    built.delete(3)
+    built.create_index('size', sorted=sorted)
+    # the same index maintained record by record
+    maintained = Table(Row)
+    maintained.create_index('size', sorted=sorted)
+    maintained.extend(records)
+    maintained.delete(3)
+
+    for size in 0, 11, 99:
+        assert built.find(size=size) == maintained.find(size=size)
+        assert built.find(size=size) == [r for r in records[:3] + records[4:]
+                                         if r.size == size]
+    if sorted:
+        assert built.range('size', 10, 20) == maintained.range('size', 10, 20)
+
+
+def test_create_index_twice():
+
+    with pytest.raises(ValueError):
+        _table(('url', False), ('url', True))
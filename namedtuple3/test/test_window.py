@@ -0,0 +1,132 @@
+# std
+import datetime
+import itertools
+# pytest
+import pytest
+# namedtuple3
+from namedtuple3 import (
+    namedtuple, tumbling_window, sliding_window, Count, Sum, Max, Last,
+)
+
+
+@namedtuple
+def LogMessage(message, server, timestamp):
+    """message for the logging system"""
+
+
+messages = [
+    LogMessage('started', 'a', 1),
+    LogMessage('request', 'b', 4),
+    LogMessage('request', 'a', 9),
+    LogMessage('request', 'a', 10),
+    LogMessage('stopped', 'b', 25),
+]
+
+
+def test_tumbling_window():
+
+    result = list(tumbling_window(messages, 'timestamp', 10, Count(),
+                                  Last('message')))
+
+    assert result == [(0, 10, 3, 'request'),
+                      (10, 20, 1, 'request'),
+                      (20, 30, 1, 'stopped')]
+    assert result[0]._fields == ('start', 'end', 'count', 'last_message')
+
+
+def test_sliding_window():
+
+    result = list(sliding_window(messages, 'timestamp', 10, 5, Count(),
+                                 Max('timestamp')))
+
+    assert result == [(-5, 5, 2, 4),
+                      (0, 10, 3, 9),
+                      (5, 15, 2, 10),
+                      (10, 20, 1, 10),
+                      (20, 30, 1, 25),
+                      (25, 35, 1, 25)]
+
+
+def test_sliding_window_with_gaps():
+
+    # windows of 2 every 5, records between the windows are not aggregated
+    result = list(sliding_window(messages, 'timestamp', 2, 5, Count()))
+
+    assert result == [(0, 2, 1), (10, 12, 1), (25, 27, 1)]
+
+
+def test_window_out_of_order_within_lateness():
+
+    records = [messages[0], messages[3], messages[1], messages[4], messages[2]]
+
+    # 9 arrives 16 behind 25
+    result = list(tumbling_window(records, 'timestamp', 10, Count(),
+                                  lateness=20))
+
+    assert result == [(0, 10, 3), (10, 20, 1), (20, 30, 1)]
+
+
+def test_window_late_records_are_dropped():
+
+    records = [messages[0], messages[3], messages[1], messages[4], messages[2]]
+
+    # 9 arrives after 25, once [0, 10) has been closed
+    result = list(tumbling_window(records, 'timestamp', 10, Count(),
+                                  lateness=5))
+
+    assert result == [(0, 10, 2), (10, 20, 1), (20, 30, 1)]
+
+
+def test_window_is_streaming():
+
+    records = (LogMessage('tick', 'a', t) for t in itertools.count())
+
+    result = tumbling_window(records, 'timestamp', 10, Sum('timestamp'))
+
+    assert list(itertools.islice(result, 2)) == [(0, 10, 45), (10, 20, 145)]
+
+
+def test_window_datetime():
+
+    start = datetime.datetime(2016, 5, 15, 12, 0, 0)
+    records = [LogMessage('request', 'a', start + datetime.timedelta(seconds=s))
+               for s in (0, 30, 59, 61, 150)]
+
+    result = list(tumbling_window(records, 'timestamp',
+                                  datetime.timedelta(minutes=1), Count(),
+                                  lateness=datetime.timedelta(seconds=10),
+                                  typename='Minute'))
+
+    minute = datetime.timedelta(minutes=1)
+    assert result == [(start, start + minute, 3),
+                      (start + minute, start + 2 * minute, 1),
+                      (start + 2 * minute, start + 3 * minute, 1)]
+    assert type(result[0]).__name__ == 'Minute'
+
+
+def test_window_no_records():
+
+    assert list(tumbling_window([], 'timestamp', 10, Count())) == []
+
+
+@pytest.mark.parametrize("size, slide, kwargs", [
+    (0, 5, {}),
+    (10, 0, {}),
+    (10, 5, {'lateness': -1}),
+])
+def test_window_invalid(size, slide, kwargs):
+
+    with pytest.raises(ValueError):
+        sliding_window(messages, 'timestamp', size, slide, Count(), **kwargs)
+
+
+def test_window_unknown_field():
+
+    with pytest.raises(ValueError):
+        tumbling_window(messages, 'time', 10, Count())
+
+
+def test_window_unexpected_kwarg():
+
+    with pytest.raises(TypeError):
+        tumbling_window(messages, 'timestamp', 10, Count(), presorted=True)